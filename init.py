@@ -7,14 +7,88 @@ Supports interactive mode for selective game export
 """
 
 import os
+import errno
+import hashlib
+import logging
+import shutil
+import stat
 import sys
+import threading
+import time
+import zlib
 import argparse
-import logging
+import atexit
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import AbstractSet, List, Dict, Optional, Tuple
 import json
-from difflib import SequenceMatcher
-import re
+import xml.etree.ElementTree as ET
+
+# Heavier modules only the export itself needs (logging.handlers, difflib,
+# concurrent.futures, rapidfuzz) are imported where they are used, so that
+# --list-formats and --show-mappings start up without them
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson is optional - fall back to the standard library parser
+    orjson = None
+    _json_loads = json.loads
+
+
+def _json_dumps_indented(data) -> bytes:
+    """
+    Serialize data as JSON indented by 2 spaces (orjson's C encoder when available)
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _load_rapidfuzz() -> Tuple:
+    """
+    Import rapidfuzz on first use
+    
+    Returns:
+        (fuzz, process) modules, or (None, None) if rapidfuzz is not installed
+        (callers then fall back to difflib's SequenceMatcher)
+    """
+    try:
+        from rapidfuzz import fuzz, process
+    except ImportError:
+        return None, None
+    return fuzz, process
+
+# Horizontal rules used to frame console output and the export report
+_HRULE = "=" * 70
+_HRULE_BANG = "!" * 70
+_HRULE_DASH = "-" * 70
+
+# Translation tables for deriving system/playlist names from archive platform names
+_ES_NAME_TABLE = str.maketrans('', '', ' -')  # ES-DE system names: drop spaces and dashes
+_RA_NAME_TABLE = str.maketrans(' ', '_')  # RetroArch playlist names: spaces to underscores
+
+# Minimum seconds between in-place progress updates (caps terminal writes at ~4/s)
+_PROGRESS_INTERVAL = 0.25
+
+# Shown when Windows refuses to create a symlink (ERROR_PRIVILEGE_NOT_HELD)
+_SYMLINK_PRIVILEGE_HELP = (
+    "Symlink creation failed: Insufficient privileges\n"
+    "  On Windows, you need either:\n"
+    "  1. Run as Administrator, OR\n"
+    "  2. Enable Developer Mode (Settings > Update & Security > For Developers)\n"
+    "  Alternatively, use --no-symlink to copy files instead"
+)
 
 
 class ArchiveExporter:
@@ -26,10 +100,25 @@ class ArchiveExporter:
     # Path to formats configuration file
     FORMATS_CONFIG_FILE = "fe_formats.json"
     
+    # Contents of a new, empty ES-DE custom systems file
+    CUSTOM_SYSTEMS_TEMPLATE = b'<?xml version="1.0"?>\n<systemList>\n</systemList>\n'
+    
+    # Whether this process can create symlinks (probed once, see _symlinks_supported)
+    _symlink_capable: Optional[bool] = None
+    
+    # Worker threads for parallel filesystem scans (I/O bound - overlaps NFS round-trips)
+    SCAN_WORKERS = 16
+    
+    # Parsed formats config file contents, keyed by (absolute config path, mtime)
+    _formats_cache: Dict[Tuple[str, float], Dict] = {}
+    # id()s of cached 'formats' dicts that already passed validation (the
+    # dicts stay referenced by _formats_cache, so their ids are never reused)
+    _validated_formats: set = set()
+    
     def __init__(self, source_path: str, destination_path: Optional[str], 
                  dest_format: str = 'es-de', config_path: Optional[str] = None,
                  dry_run: bool = False, verbose: bool = False, use_symlinks: bool = True,
-                 backport: bool = False):
+                 backport: bool = False, verify: bool = False, refresh_cache: bool = False):
         """
         Initialize the archive exporter
         
@@ -42,15 +131,20 @@ class ArchiveExporter:
             verbose: Enable verbose logging
             use_symlinks: If True, create symlinks; if False, copy files (default: True)
             backport: If True, copy metadata from destination back to archive if missing
+            verify: If True, re-check that each created symlink resolves to its source
+            refresh_cache: If True, ignore cached game scans from previous runs
         """
         self.source = Path(source_path)
         self.dest_format = dest_format.lower()
         self.config_path = config_path
+        self._config_file: Optional[Path] = Path(config_path) if config_path else None
         self.config = {}
         self.dry_run = dry_run
         self.verbose = verbose
         self.use_symlinks = use_symlinks
         self.backport = backport
+        self.verify = verify
+        self.refresh_cache = refresh_cache
         self.logger = self._setup_logging()
         
         # Load supported formats from JSON file
@@ -65,9 +159,15 @@ class ArchiveExporter:
         
         self.format_config = self.supported_formats[self.dest_format]
         
-        # Load platform mappings
-        self.platform_mappings = self.format_config.get('platform_mappings', {})
+        # Load platform mappings (copied - session additions must not leak into
+        # the shared formats cache)
+        self.platform_mappings = dict(self.format_config.get('platform_mappings', {}))
+        self._parsed_metadata_mappings = self._parse_metadata_mappings()
         self.custom_systems_path = self.format_config.get('custom_systems_path')
+        # Expanded once here rather than on every custom system/playlist lookup
+        self._custom_systems_file: Optional[Path] = (
+            Path(self.custom_systems_path).expanduser() if self.custom_systems_path else None
+        )
         
         # Determine destination - use override if provided, otherwise format default
         if destination_path:
@@ -80,24 +180,50 @@ class ArchiveExporter:
         
         self.logger.info(f"Destination format: {self.format_config['name']}")
         
-        # Check if custom metadata path is configured
+        # Check if custom metadata path is configured (expanded once - used per metadata file)
         metadata_path = self.format_config.get('metadata_path')
-        if metadata_path:
-            metadata_path_expanded = Path(metadata_path).expanduser()
-            self.logger.info(f"Using custom metadata path: {metadata_path_expanded}")
+        self._metadata_base: Optional[Path] = Path(metadata_path).expanduser() if metadata_path else None
+        if self._metadata_base:
+            self.logger.info(f"Using custom metadata path: {self._metadata_base}")
         
         # Cache for scanned data
         self.available_platforms = {}
+        self._platforms_lower: List[Tuple[str, str]] = []  # (platform, lowercased) for fuzzy matching
+        # Fuzzy match results for repeated identical queries
+        self._platform_match_cache: Dict[Tuple[str, float], List[Tuple[str, float]]] = {}
+        self._games_match_cache: Dict[Tuple[str, str, float], List[Tuple[Dict, float]]] = {}
         self.platform_games = {}
-        self.unmapped_platforms = []  # Track platforms without mappings
+        self._games_cache_dir = self._get_cache_dir()  # Game scans persisted between runs
+        self._created_dirs = set()  # Destination directories already created this run
+        # Track platforms without mappings (dict used as an ordered set: O(1)
+        # membership, report order preserved)
+        self.unmapped_platforms: Dict[str, None] = {}
         self.auto_select_metadata = False  # Flag for auto-selecting first metadata file
         self.metadata_subdir_cache = {}  # Cache subdirectory selections per archive_path
         self.global_metadata_subdirs = None  # Global list of selected subdirectories for all platforms
         self.metadata_subdirs_scanned = False  # Flag to track if we've done the global scan
+        # Sorted (stems, paths) per metadata directory for prefix lookups {(dir, recursive): index}
+        self._metadata_index: Dict[Tuple[str, bool], Tuple[List[str], List[str]]] = {}
         
         # XML metadata support
         self.xml_metadata = {}  # Cache for parsed XML metadata {platform: {game_name: metadata_dict}}
         
+        # Parsed custom systems XML, reused until the file's mtime changes
+        self._custom_systems_tree = None
+        self._custom_systems_mtime = None
+        self._custom_fullname_to_name = {}  # Custom system fullname -> system name
+        self._custom_system_names = set()  # Names of all defined custom systems
+        self._template_written = False  # Custom systems file known to exist
+        self._custom_systems_dirty = False  # Tree has additions not yet written to disk
+        # RetroArch playlist names {lowercased stem: stem}, reused until the directory's mtime changes
+        self._playlist_names: Dict[str, str] = {}
+        self._playlist_names_mtime: Optional[int] = None
+        # Parsed RetroArch playlists {playlist file: (mtime, data, item paths)}, reused until the file changes
+        self._playlist_cache: Dict[Path, Tuple[int, Dict, set]] = {}
+        # Playlists with added games not yet written {playlist file: (data, item paths)}
+        self._pending_playlists: Dict[Path, Tuple[Dict, set]] = {}
+        self._playlist_flush_registered = False
+        
         # Validate paths
         self._validate_paths()
         
@@ -107,14 +233,26 @@ class ArchiveExporter:
     
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration"""
+        import logging.handlers
+        
         log_level = logging.DEBUG if self.verbose else logging.INFO
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        
+        # The log file gets records in batches of up to 1024 instead of a write
+        # and flush per record; warnings and errors are flushed straight away
+        file_handler = logging.FileHandler('archive_export.log', delay=True)
+        file_handler.setFormatter(logging.Formatter(log_format))
+        buffered_file_handler = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.WARNING, target=file_handler
+        )
+        atexit.register(buffered_file_handler.flush)
         
         logging.basicConfig(
             level=log_level,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[
                 logging.StreamHandler(sys.stdout),
-                logging.FileHandler('archive_export.log')
+                buffered_file_handler
             ]
         )
         logger = logging.getLogger('ArchiveExporter')
@@ -128,6 +266,64 @@ class ArchiveExporter:
         
         return logger
     
+    @classmethod
+    def _symlinks_supported(cls) -> bool:
+        """
+        Check whether symlinks can be created, probing only once per process
+        
+        Returns:
+            True if symlinks can be created, False otherwise
+        """
+        if cls._symlink_capable is None:
+            if sys.platform != 'win32':
+                cls._symlink_capable = True
+            else:
+                import tempfile
+                with tempfile.TemporaryDirectory() as probe_dir:
+                    target = os.path.join(probe_dir, 'target')
+                    open(target, 'w').close()
+                    try:
+                        os.symlink(target, os.path.join(probe_dir, 'link'))
+                        cls._symlink_capable = True
+                    except OSError:
+                        cls._symlink_capable = False
+        
+        return cls._symlink_capable
+    
+    @classmethod
+    def read_formats_file(cls) -> Tuple[Path, Dict]:
+        """
+        Locate and parse the formats configuration file
+        
+        The parsed contents are cached per process (until the file changes), so
+        the CLI helpers and every exporter instance share a single parse.
+        
+        Returns:
+            Tuple of (config file path, parsed JSON data)
+        """
+        # Look for config file in same directory as script
+        script_dir = Path(__file__).parent
+        config_file = script_dir / cls.FORMATS_CONFIG_FILE
+        
+        if not config_file.exists():
+            # Fallback to current directory
+            config_file = Path(cls.FORMATS_CONFIG_FILE)
+        
+        if not config_file.exists():
+            raise FileNotFoundError(
+                f"Formats configuration file not found: {cls.FORMATS_CONFIG_FILE}"
+            )
+        
+        # Reuse the already parsed config unless the file has changed
+        config_path = os.path.abspath(config_file)
+        cache_key = (config_path, os.path.getmtime(config_path))
+        config_data = cls._formats_cache.get(cache_key)
+        if config_data is None:
+            config_data = _json_loads(config_file.read_bytes())
+            cls._formats_cache[cache_key] = config_data
+        
+        return config_file, config_data
+    
     def _load_formats_config(self) -> Dict:
         """
         Load supported formats configuration from JSON file
@@ -136,21 +332,7 @@ class ArchiveExporter:
             Dictionary of supported formats
         """
         try:
-            # Look for config file in same directory as script
-            script_dir = Path(__file__).parent
-            config_file = script_dir / self.FORMATS_CONFIG_FILE
-            
-            if not config_file.exists():
-                # Fallback to current directory
-                config_file = Path(self.FORMATS_CONFIG_FILE)
-            
-            if not config_file.exists():
-                raise FileNotFoundError(
-                    f"Formats configuration file not found: {self.FORMATS_CONFIG_FILE}"
-                )
-            
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
+            config_file, config_data = self.read_formats_file()
             
             if 'formats' not in config_data:
                 raise ValueError(
@@ -158,10 +340,12 @@ class ArchiveExporter:
                 )
             
             formats = config_data['formats']
-            self.logger.debug(f"Loaded {len(formats)} format(s) from {config_file}")
+            self.logger.debug("Loaded %d format(s) from %s", len(formats), config_file)
             
-            # Validate format configurations
-            self._validate_format_configs(formats)
+            # Validate format configurations (once per parse of the file)
+            if id(formats) not in self._validated_formats:
+                self._validate_format_configs(formats)
+                self._validated_formats.add(id(formats))
             
             return formats
             
@@ -203,7 +387,28 @@ class ArchiveExporter:
                     f"Format '{format_id}' has empty 'default_destination' field"
                 )
             
-            self.logger.debug(f"Validated format configuration: {format_id}")
+            self.logger.debug("Validated format configuration: %s", format_id)
+    
+    def _parse_metadata_mappings(self) -> List[Tuple[str, str, str, Optional[str], str]]:
+        """
+        Split the format's metadata mappings once for the export/backport loops
+        
+        Returns:
+            List of (archive_path, dest_name, metadata_type, subdir or None, stats key)
+            tuples, skipping mappings whose destination is null (not supported)
+        """
+        parsed = []
+        for archive_path, dest_name in self.format_config.get('metadata_mappings', {}).items():
+            if dest_name is None:
+                continue
+            
+            # e.g., "Images/Box - Front" -> ("Images", "Box - Front"), "Videos" -> ("Videos", None)
+            path_parts = archive_path.split('/', 1)
+            metadata_type = path_parts[0]
+            subdir = path_parts[1] if len(path_parts) > 1 else None
+            parsed.append((archive_path, dest_name, metadata_type, subdir, metadata_type.lower()))
+        
+        return parsed
     
     def map_platform_name(self, archive_platform_name: str) -> Optional[str]:
         """
@@ -218,6 +423,10 @@ class ArchiveExporter:
         mapped_name = self.platform_mappings.get(archive_platform_name)
         
         if not mapped_name:
+            # Already checked and unmapped - skip the custom system/playlist lookup
+            if archive_platform_name in self.unmapped_platforms:
+                return mapped_name
+            
             # Check if it exists as a custom system/playlist before warning
             if self.dest_format == 'es-de':
                 existing_system = self.check_existing_custom_system(archive_platform_name)
@@ -232,8 +441,7 @@ class ArchiveExporter:
             
             # Only warn if it's not a custom system/playlist
             self.logger.warning(f"No platform mapping found for: {archive_platform_name}")
-            if archive_platform_name not in self.unmapped_platforms:
-                self.unmapped_platforms.append(archive_platform_name)
+            self.unmapped_platforms[archive_platform_name] = None
         
         return mapped_name
     
@@ -250,38 +458,68 @@ class ArchiveExporter:
         if not self.custom_systems_path:
             return None
         
-        custom_systems_file = Path(self.custom_systems_path).expanduser()
-        
-        if not custom_systems_file.exists():
-            return None
+        custom_systems_file = self._custom_systems_file
         
         try:
-            import xml.etree.ElementTree as ET
-            
-            tree = ET.parse(custom_systems_file)
-            root = tree.getroot()
+            if self._load_custom_systems_tree(custom_systems_file) is None:
+                return None
             
-            # Look through all systems to find one with matching fullname or close match
-            for system in root.findall('system'):
-                name_elem = system.find('name')
-                fullname_elem = system.find('fullname')
-                
-                if name_elem is not None and fullname_elem is not None:
-                    # Check if fullname matches archive platform name
-                    if fullname_elem.text == archive_platform_name:
-                        system_name = name_elem.text
-                        self.logger.info(
-                            f"Found existing custom system for '{archive_platform_name}': {system_name}"
-                        )
-                        # Add to platform mappings for this session
-                        self.platform_mappings[archive_platform_name] = system_name
-                        return system_name
+            # Look up a system whose fullname matches the archive platform name
+            system_name = self._custom_fullname_to_name.get(archive_platform_name)
+            if system_name:
+                self.logger.info(
+                    f"Found existing custom system for '{archive_platform_name}': {system_name}"
+                )
+                # Add to platform mappings for this session
+                self.platform_mappings[archive_platform_name] = system_name
+                return system_name
             
         except Exception as e:
             self.logger.warning(f"Error checking existing custom systems: {e}")
         
         return None
     
+    def _load_custom_systems_tree(self, custom_systems_file: Path) -> Optional[ET.ElementTree]:
+        """
+        Parse the custom systems XML, reusing the cached tree while the file is unchanged
+        
+        Args:
+            custom_systems_file: Path to the custom systems XML file
+            
+        Returns:
+            Parsed ElementTree, or None if the file does not exist
+        """
+        # Pending additions only exist in memory - never replace them with the file
+        if self._custom_systems_dirty:
+            return self._custom_systems_tree
+        
+        try:
+            mtime = custom_systems_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+        if self._custom_systems_tree is None or mtime != self._custom_systems_mtime:
+            tree = ET.parse(custom_systems_file)
+            
+            # Index systems by fullname and name in a single pass so lookups are
+            # a single dict/set check (first definition wins, matching the old linear scan)
+            fullname_to_name = {}
+            system_names = set()
+            for system in tree.getroot().iterfind('system'):
+                fullname = system.findtext('fullname')
+                name = system.findtext('name')
+                if name is not None:
+                    system_names.add(name)
+                if fullname and name:
+                    fullname_to_name.setdefault(fullname, name)
+            
+            self._custom_systems_tree = tree
+            self._custom_fullname_to_name = fullname_to_name
+            self._custom_system_names = system_names
+            self._custom_systems_mtime = mtime
+        
+        return self._custom_systems_tree
+    
     def prompt_add_custom_system(self, archive_platform_name: str) -> Optional[Dict]:
         """
         Prompt user to add a custom system for an unmapped platform
@@ -292,9 +530,9 @@ class ArchiveExporter:
         Returns:
             Dictionary with custom system information, or None if skipped
         """
-        print(f"\n{'='*70}")
+        print("\n" + _HRULE)
         print(f"UNMAPPED PLATFORM: {archive_platform_name}")
-        print(f"{'='*70}")
+        print(_HRULE)
         print(f"This platform is not mapped in the {self.dest_format} configuration.")
         print(f"You can add it as a custom system to ES-DE.")
         print()
@@ -309,7 +547,7 @@ class ArchiveExporter:
         print("\nEnter system information (press Enter for default):")
         
         # Suggest a system name based on archive name
-        default_name = archive_platform_name.lower().replace(' ', '').replace('-', '')
+        default_name = archive_platform_name.lower().translate(_ES_NAME_TABLE)
         system_name = input(f"System name [{default_name}]: ").strip() or default_name
         
         full_name = input(f"Full name [{archive_platform_name}]: ").strip() or archive_platform_name
@@ -362,36 +600,30 @@ class ArchiveExporter:
             self.logger.error("No custom systems path configured for this format")
             return False
         
-        custom_systems_file = Path(self.custom_systems_path).expanduser()
+        custom_systems_file = self._custom_systems_file
         
         # Create the directory if it doesn't exist
         custom_systems_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Check if file exists, create template if not
-        if not custom_systems_file.exists():
-            self.logger.info(f"Creating new custom systems file: {custom_systems_file}")
-            xml_content = '<?xml version="1.0"?>\n<systemList>\n</systemList>\n'
-            custom_systems_file.write_text(xml_content)
+        if self._ensure_custom_systems_template(custom_systems_file):
+            self.logger.info(f"Created new custom systems file: {custom_systems_file}")
         
         try:
-            import xml.etree.ElementTree as ET
-            
-            # Parse existing file
-            tree = ET.parse(custom_systems_file)
+            # Parse existing file (or reuse the tree holding this session's additions)
+            tree = self._load_custom_systems_tree(custom_systems_file)
             root = tree.getroot()
             
             # Check if system already exists
-            for system in root.findall('system'):
-                name_elem = system.find('name')
-                if name_elem is not None and name_elem.text == custom_system['name']:
-                    self.logger.warning(f"System '{custom_system['name']}' already exists in custom systems")
-                    # Add to platform mappings for this session even though we're not adding it
-                    self.platform_mappings[custom_system['archive_name']] = custom_system['name']
-                    print(f"ℹ System '{custom_system['name']}' already exists, using existing configuration")
-                    return True
-            
-            # Create new system element
-            system = ET.SubElement(root, 'system')
+            if custom_system['name'] in self._custom_system_names:
+                self.logger.warning(f"System '{custom_system['name']}' already exists in custom systems")
+                # Add to platform mappings for this session even though we're not adding it
+                self.platform_mappings[custom_system['archive_name']] = custom_system['name']
+                print(f"ℹ System '{custom_system['name']}' already exists, using existing configuration")
+                return True
+            
+            # Create new system element (only attached to the tree when not a dry-run)
+            system = ET.Element('system')
             
             name_elem = ET.SubElement(system, 'name')
             name_elem.text = custom_system['name']
@@ -414,26 +646,30 @@ class ArchiveExporter:
             theme_elem = ET.SubElement(system, 'theme')
             theme_elem.text = custom_system['name']
             
-            # Format XML
-            self._indent_xml(root)
-            
             # Show preview of what will be added
             system_xml = self._format_system_element(system)
-            print(f"\n{'='*70}")
+            print("\n" + _HRULE)
             print("CUSTOM SYSTEM XML TO BE ADDED:")
-            print(f"{'='*70}")
+            print(_HRULE)
             print(system_xml)
-            print(f"{'='*70}")
+            print(_HRULE)
             
             if self.dry_run:
                 print(f"\nDRY-RUN: Would add to {custom_systems_file}")
             else:
                 print(f"\nTarget file: {custom_systems_file}")
             
-            # Write XML (unless dry-run)
+            # Add to the in-memory tree (unless dry-run); flush_custom_systems()
+            # writes the file once for all additions made this session
             if not self.dry_run:
-                tree.write(custom_systems_file, encoding='utf-8', xml_declaration=True)
-                self.logger.info(f"Added custom system '{custom_system['name']}' to {custom_systems_file}")
+                root.append(system)
+                self._custom_fullname_to_name.setdefault(custom_system['fullname'], custom_system['name'])
+                self._custom_system_names.add(custom_system['name'])
+                if not self._custom_systems_dirty:
+                    self._custom_systems_dirty = True
+                    # Make sure additions are saved even if the export is interrupted
+                    atexit.register(self.flush_custom_systems)
+                self.logger.info(f"Added custom system '{custom_system['name']}' (pending write to {custom_systems_file})")
                 print(f"\n✓ Successfully added '{custom_system['fullname']}' as custom system")
                 print(f"  System directory: {custom_system['path']}")
                 print(f"  You may need to restart ES-DE to see the new system")
@@ -450,6 +686,62 @@ class ArchiveExporter:
             self.logger.error(f"Error updating custom systems XML: {e}")
             return False
     
+    def flush_custom_systems(self) -> bool:
+        """
+        Write pending custom system additions to the ES-DE custom systems XML
+        
+        update_es_systems_xml only adds systems to the in-memory tree, so the
+        file is rewritten once per session instead of once per added system.
+        
+        Returns:
+            True if nothing was pending or the write succeeded, False otherwise
+        """
+        if not self._custom_systems_dirty:
+            return True
+        
+        custom_systems_file = self._custom_systems_file
+        tree = self._custom_systems_tree
+        root = tree.getroot()
+        
+        try:
+            # Format XML
+            self._indent_xml(root)
+            root.tail = "\n"
+            
+            tree.write(custom_systems_file, encoding='utf-8', xml_declaration=True)
+            
+            # Our own write shouldn't invalidate the cached tree
+            self._custom_systems_mtime = custom_systems_file.stat().st_mtime_ns
+            self._custom_systems_dirty = False
+            self.logger.info(f"Saved custom systems to {custom_systems_file}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error writing custom systems XML: {e}")
+            return False
+    
+    def _ensure_custom_systems_template(self, custom_systems_file: Path) -> bool:
+        """
+        Create an empty custom systems XML file if it doesn't exist yet
+        
+        Args:
+            custom_systems_file: Path to the custom systems XML file
+            
+        Returns:
+            True if the file was created, False if it already existed
+        """
+        # Once the file is known to exist, skip the stat() on later calls
+        if self._template_written:
+            return False
+        
+        created = False
+        if not custom_systems_file.exists():
+            custom_systems_file.write_bytes(self.CUSTOM_SYSTEMS_TEMPLATE)
+            created = True
+        
+        self._template_written = True
+        return created
+    
     def check_existing_retroarch_playlist(self, archive_platform_name: str) -> Optional[str]:
         """
         Check if a RetroArch playlist already exists for this platform
@@ -463,30 +755,57 @@ class ArchiveExporter:
         if not self.custom_systems_path or self.dest_format != 'retroarch':
             return None
         
-        playlists_dir = Path(self.custom_systems_path).expanduser()
-        
-        if not playlists_dir.exists():
-            return None
+        playlists_dir = self._custom_systems_file
         
         try:
-            # Look for .lpl files that might match
-            for playlist_file in playlists_dir.glob('*.lpl'):
-                playlist_name = playlist_file.stem
-                
-                # Check if the playlist name matches the archive platform name
-                if playlist_name.lower() == archive_platform_name.lower().replace(' ', '_'):
-                    self.logger.info(
-                        f"Found existing RetroArch playlist for '{archive_platform_name}': {playlist_name}"
-                    )
-                    # Add to platform mappings for this session
-                    self.platform_mappings[archive_platform_name] = playlist_name
-                    return playlist_name
+            # Check if a playlist name matches the archive platform name
+            playlist_names = self._get_playlist_names(playlists_dir)
+            playlist_name = playlist_names.get(archive_platform_name.lower().translate(_RA_NAME_TABLE))
+            if playlist_name:
+                self.logger.info(
+                    f"Found existing RetroArch playlist for '{archive_platform_name}': {playlist_name}"
+                )
+                # Add to platform mappings for this session
+                self.platform_mappings[archive_platform_name] = playlist_name
+                return playlist_name
             
         except Exception as e:
             self.logger.warning(f"Error checking existing RetroArch playlists: {e}")
         
         return None
     
+    def _get_playlist_names(self, playlists_dir: Path) -> Dict[str, str]:
+        """
+        List the RetroArch playlists in a directory, reusing the listing while
+        the directory is unchanged
+        
+        Args:
+            playlists_dir: RetroArch playlists directory
+            
+        Returns:
+            Dictionary of lowercased playlist name -> playlist name (empty if
+            the directory does not exist)
+        """
+        try:
+            mtime = playlists_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        
+        if mtime != self._playlist_names_mtime:
+            playlist_names = {}
+            try:
+                with os.scandir(playlists_dir) as scanner:
+                    for entry in scanner:
+                        stem, ext = os.path.splitext(entry.name)
+                        if ext == '.lpl':
+                            playlist_names.setdefault(stem.lower(), stem)
+            except NotADirectoryError:
+                pass
+            self._playlist_names = playlist_names
+            self._playlist_names_mtime = mtime
+        
+        return self._playlist_names
+    
     def prompt_add_retroarch_playlist(self, archive_platform_name: str) -> Optional[Dict]:
         """
         Prompt user to add a RetroArch playlist for an unmapped platform
@@ -497,9 +816,9 @@ class ArchiveExporter:
         Returns:
             Dictionary with playlist information, or None if skipped
         """
-        print(f"\n{'='*70}")
+        print("\n" + _HRULE)
         print(f"UNMAPPED PLATFORM: {archive_platform_name}")
-        print(f"{'='*70}")
+        print(_HRULE)
         print(f"This platform is not mapped in the RetroArch configuration.")
         print(f"You can add it as a custom playlist.")
         print()
@@ -514,7 +833,7 @@ class ArchiveExporter:
         print("\nEnter playlist information (press Enter for default):")
         
         # Suggest a playlist name based on archive name
-        default_name = archive_platform_name.replace(' ', '_')
+        default_name = archive_platform_name.translate(_RA_NAME_TABLE)
         playlist_name = input(f"Playlist name [{default_name}]: ").strip() or default_name
         
         full_name = input(f"Display name [{archive_platform_name}]: ").strip() or archive_platform_name
@@ -545,7 +864,7 @@ class ArchiveExporter:
             self.logger.error("No playlists path configured for RetroArch")
             return False
         
-        playlists_dir = Path(self.custom_systems_path).expanduser()
+        playlists_dir = self._custom_systems_file
         
         # Create the playlists directory if it doesn't exist
         playlists_dir.mkdir(parents=True, exist_ok=True)
@@ -553,8 +872,6 @@ class ArchiveExporter:
         playlist_file = playlists_dir / f"{playlist_info['name']}.lpl"
         
         try:
-            import json
-            
             # Check if playlist already exists
             if playlist_file.exists():
                 self.logger.warning(f"Playlist '{playlist_info['name']}' already exists")
@@ -577,13 +894,13 @@ class ArchiveExporter:
             }
             
             # Show preview
-            print(f"\n{'='*70}")
+            print("\n" + _HRULE)
             print("RETROARCH PLAYLIST TO BE CREATED:")
-            print(f"{'='*70}")
+            print(_HRULE)
             print(f"File: {playlist_file}")
             print(f"Display Name: {playlist_info['fullname']}")
             print(f"Default Core: {playlist_info.get('default_core', 'DETECT')}")
-            print(f"{'='*70}")
+            print(_HRULE)
             
             if self.dry_run:
                 print(f"\nDRY-RUN: Would create playlist at {playlist_file}")
@@ -592,8 +909,10 @@ class ArchiveExporter:
             
             # Write playlist (unless dry-run)
             if not self.dry_run:
-                with open(playlist_file, 'w', encoding='utf-8') as f:
-                    json.dump(playlist_data, f, indent=2)
+                playlist_file.write_bytes(_json_dumps_indented(playlist_data))
+                # Keep the playlist name index current even if the directory's
+                # mtime doesn't tick (coarse timestamps on some network shares)
+                self._playlist_names.setdefault(playlist_info['name'].lower(), playlist_info['name'])
                 
                 self.logger.info(f"Created RetroArch playlist: {playlist_file}")
                 print(f"\n✓ Successfully created playlist '{playlist_info['fullname']}'")
@@ -627,27 +946,27 @@ class ArchiveExporter:
         if not self.custom_systems_path or self.dest_format != 'retroarch':
             return False
         
-        playlists_dir = Path(self.custom_systems_path).expanduser()
+        playlists_dir = self._custom_systems_file
         playlist_file = playlists_dir / f"{platform_name}.lpl"
         
-        if not playlist_file.exists():
-            self.logger.warning(f"Playlist file does not exist: {playlist_file}")
-            return False
-        
         try:
-            import json
-            
-            # Load existing playlist
-            with open(playlist_file, 'r', encoding='utf-8') as f:
-                playlist_data = json.load(f)
+            # Load existing playlist (games added earlier this session are still pending)
+            playlist = self._pending_playlists.get(playlist_file) or self._load_playlist(playlist_file)
+            if playlist is None:
+                self.logger.warning(f"Playlist file does not exist: {playlist_file}")
+                return False
+            playlist_data, item_paths = playlist
             
             # Check if game already exists in playlist
             # Use the symlink/copied path, not the resolved original path
+            # (absolute() returns the path as-is when export_games already made it absolute)
             rom_path_str = str(rom_path.absolute())
-            for item in playlist_data.get('items', []):
-                if item.get('path') == rom_path_str:
-                    # Game already in playlist
-                    return True
+            if rom_path_str in item_paths:
+                # Game already in playlist
+                return True
+            
+            if self.dry_run:
+                return True
             
             # Create game entry
             # RetroArch playlist item structure
@@ -660,16 +979,15 @@ class ArchiveExporter:
                 "db_name": f"{platform_name}.lpl"
             }
             
-            # Add to playlist
-            if 'items' not in playlist_data:
-                playlist_data['items'] = []
-            
-            playlist_data['items'].append(game_entry)
-            
-            # Write updated playlist
-            if not self.dry_run:
-                with open(playlist_file, 'w', encoding='utf-8') as f:
-                    json.dump(playlist_data, f, indent=2)
+            # Add to playlist - flush_retroarch_playlists() writes the file once
+            # for all games added to it
+            playlist_data.setdefault('items', []).append(game_entry)
+            item_paths.add(rom_path_str)
+            self._pending_playlists[playlist_file] = playlist
+            if not self._playlist_flush_registered:
+                self._playlist_flush_registered = True
+                # Make sure additions are saved even if the export is interrupted
+                atexit.register(self.flush_retroarch_playlists)
             
             return True
             
@@ -677,26 +995,82 @@ class ArchiveExporter:
             self.logger.error(f"Error adding game to RetroArch playlist: {e}")
             return False
     
+    def flush_retroarch_playlists(self) -> bool:
+        """
+        Write RetroArch playlists that have games added but not yet saved
+        
+        add_game_to_retroarch_playlist only adds entries in memory, so each
+        playlist is rewritten once per flush instead of once per game.
+        
+        Returns:
+            True if nothing was pending or all writes succeeded, False otherwise
+        """
+        success = True
+        for playlist_file, (playlist_data, item_paths) in list(self._pending_playlists.items()):
+            try:
+                playlist_file.write_bytes(_json_dumps_indented(playlist_data))
+                # Our own write shouldn't invalidate the cached playlist
+                self._playlist_cache[playlist_file] = (playlist_file.stat().st_mtime_ns, playlist_data, item_paths)
+                del self._pending_playlists[playlist_file]
+                self.logger.debug("Saved RetroArch playlist %s", playlist_file)
+            except Exception as e:
+                self.logger.error(f"Error writing RetroArch playlist {playlist_file}: {e}")
+                success = False
+        
+        return success
+    
+    def _load_playlist(self, playlist_file: Path) -> Optional[Tuple[Dict, set]]:
+        """
+        Parse a RetroArch playlist, reusing the cached data while the file is unchanged
+        
+        Args:
+            playlist_file: Path to the .lpl playlist file
+            
+        Returns:
+            Tuple of (parsed playlist data, set of item paths), or None if the
+            file does not exist
+        """
+        try:
+            mtime = playlist_file.stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        
+        cached = self._playlist_cache.get(playlist_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+        
+        playlist_data = _json_loads(playlist_file.read_bytes())
+        item_paths = {item.get('path') for item in playlist_data.get('items', [])}
+        self._playlist_cache[playlist_file] = (mtime, playlist_data, item_paths)
+        return playlist_data, item_paths
+    
     def _validate_paths(self):
         """Validate source and destination paths, and ensure format-specific directories exist"""
-        # Validate source path
-        if not self.source.exists():
+        # Validate source path (a single stat() - every call is a round-trip on NFS)
+        try:
+            source_stat = self.source.stat()
+        except (FileNotFoundError, NotADirectoryError):
             raise ValueError(f"Source path does not exist: {self.source}")
         
-        if not self.source.is_dir():
+        if not stat.S_ISDIR(source_stat.st_mode):
             raise ValueError(f"Source path is not a directory: {self.source}")
         
-        # Validate source archive structure
+        # Validate source archive structure from one listing of the archive root
         games_path = self.source / 'Games'
         metadata_path = self.source / 'Metadata'
         
-        if not games_path.exists():
+        with os.scandir(self.source) as entries:
+            source_entries = {entry.name: entry for entry in entries}
+        
+        games_entry = source_entries.get('Games')
+        if games_entry is None or not games_entry.is_dir():
             raise ValueError(
                 f"Invalid master archive structure: 'Games' directory not found at {games_path}\n"
                 f"Expected structure: {self.source}/Games/[Platform]/[games]"
             )
         
-        if not metadata_path.exists():
+        metadata_entry = source_entries.get('Metadata')
+        if metadata_entry is None or not metadata_entry.is_dir():
             self.logger.warning(
                 f"Metadata directory not found at {metadata_path}\n"
                 f"Metadata export will be skipped unless this directory exists"
@@ -723,7 +1097,7 @@ class ArchiveExporter:
         
         # Validate and create custom systems directory if specified
         if self.custom_systems_path:
-            custom_systems_file = Path(self.custom_systems_path).expanduser()
+            custom_systems_file = self._custom_systems_file
             custom_systems_dir = custom_systems_file.parent
             
             try:
@@ -733,9 +1107,7 @@ class ArchiveExporter:
                         self.logger.info(f"Created custom systems directory: {custom_systems_dir}")
                     
                     # Create template XML file if it doesn't exist
-                    if not custom_systems_file.exists():
-                        xml_content = '<?xml version="1.0"?>\n<systemList>\n</systemList>\n'
-                        custom_systems_file.write_text(xml_content)
+                    if self._ensure_custom_systems_template(custom_systems_file):
                         self.logger.info(f"Created custom systems template: {custom_systems_file}")
                 else:
                     if not custom_systems_dir.exists():
@@ -761,13 +1133,11 @@ class ArchiveExporter:
     def _load_config(self):
         """Load configuration from file"""
         try:
-            config_file = Path(self.config_path)
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    self.config = json.load(f)
-                self.logger.info(f"Loaded configuration from {self.config_path}")
-            else:
-                self.logger.warning(f"Config file not found: {self.config_path}")
+            # Read straight away - a missing file shows up as FileNotFoundError
+            self.config = _json_loads(self._config_file.read_bytes())
+            self.logger.info(f"Loaded configuration from {self.config_path}")
+        except FileNotFoundError:
+            self.logger.warning(f"Config file not found: {self.config_path}")
         except Exception as e:
             self.logger.error(f"Error loading config: {e}")
             self.config = {}
@@ -776,23 +1146,47 @@ class ArchiveExporter:
         """
         Add indentation to XML for pretty printing
         
+        Uses ET.indent (Python 3.9+); older versions walk the tree with an
+        explicit stack instead of recursing per element.
+        
         Args:
             elem: XML element to indent
             level: Current indentation level
         """
-        indent = "\n" + "  " * level
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = indent + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = indent
-            for child in elem:
-                self._indent_xml(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = indent
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = indent
+        if hasattr(ET, 'indent'):
+            ET.indent(elem, space="  ", level=level)
+            return
+        
+        # Indentation strings are shared by every element at the same depth
+        indents = {}
+        
+        def indent_for(depth: int) -> str:
+            indent = indents.get(depth)
+            if indent is None:
+                indent = indents[depth] = "\n" + "  " * depth
+            return indent
+        
+        if (len(elem) or level) and (not elem.tail or not elem.tail.strip()):
+            elem.tail = indent_for(level)
+        
+        stack = [(elem, level)]
+        while stack:
+            parent, depth = stack.pop()
+            if not len(parent):
+                continue
+            
+            if not parent.text or not parent.text.strip():
+                parent.text = indent_for(depth + 1)
+            
+            # Each child's tail indents its next sibling; the last child's
+            # tail indents the parent's closing tag
+            child_indent = indent_for(depth + 1)
+            for child in parent:
+                if not child.tail or not child.tail.strip():
+                    child.tail = child_indent
+                stack.append((child, depth + 1))
+            if not child.tail.strip():
+                child.tail = indent_for(depth)
     
     def _format_system_element(self, system_elem) -> str:
         """
@@ -804,17 +1198,18 @@ class ArchiveExporter:
         Returns:
             Formatted XML string
         """
-        import xml.etree.ElementTree as ET
-        
-        lines = ["  <system>"]
-        for child in system_elem:
-            if child.text:
-                lines.append(f"    <{child.tag}>{child.text}</{child.tag}>")
-            else:
-                lines.append(f"    <{child.tag} />")
-        lines.append("  </system>")
-        
-        return "\n".join(lines)
+        # Serialized by ElementTree's C accelerator, escaped exactly as the
+        # system will be written to the file (the whitespace is replaced when
+        # the whole tree is indented on save)
+        if hasattr(ET, 'indent'):
+            ET.indent(system_elem, space="  ", level=1)
+            return "  " + ET.tostring(system_elem, encoding='unicode')
+        
+        children = (
+            f"    <{child.tag}>{child.text}</{child.tag}>" if child.text else f"    <{child.tag} />"
+            for child in system_elem
+        )
+        return "\n".join(["  <system>", *children, "  </system>"])
     
     def get_available_platforms(self) -> List[str]:
         """
@@ -824,7 +1219,8 @@ class ArchiveExporter:
             List of platform names
         """
         if self.available_platforms:
-            return list(self.available_platforms.keys())
+            # Same sorted order as the first call
+            return [platform for platform, _ in self._platforms_lower]
         
         games_path = self.source / 'Games'
         if not games_path.exists():
@@ -832,14 +1228,43 @@ class ArchiveExporter:
             return []
         
         platforms = []
-        for item in games_path.iterdir():
-            if item.is_dir():
-                platforms.append(item.name)
-                self.available_platforms[item.name] = item
+        # DirEntry.is_dir() uses the type returned by readdir, avoiding a
+        # stat() round-trip per entry on the NFS mount
+        with os.scandir(games_path) as scanner:
+            entries = list(scanner)
+        
+        # Symlinks (and filesystems that don't report entry types) still need a
+        # stat() per entry, so resolve them in parallel
+        entry_is_dir = self._parallel_map(lambda entry: entry.is_dir(), entries)
+        
+        for entry, is_dir in zip(entries, entry_is_dir):
+            if is_dir:
+                platforms.append(entry.name)
+                self.available_platforms[entry.name] = Path(entry.path)
         
         platforms.sort()
+        self._platforms_lower = [(platform, platform.lower()) for platform in platforms]
         return platforms
     
+    def _parallel_map(self, func, items: List) -> List:
+        """
+        Apply a filesystem-bound function to every item using a thread pool
+        
+        Args:
+            func: Function to call for each item
+            items: Items to process
+            
+        Returns:
+            List of results in the same order as items
+        """
+        if len(items) < 2:
+            return [func(item) for item in items]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=min(self.SCAN_WORKERS, len(items))) as executor:
+            return list(executor.map(func, items))
+    
     def fuzzy_match_platform(self, query: str, threshold: float = 0.6) -> List[Tuple[str, float]]:
         """
         Find platforms matching the query using fuzzy matching
@@ -851,14 +1276,48 @@ class ArchiveExporter:
         Returns:
             List of (platform_name, score) tuples sorted by score
         """
-        platforms = self.get_available_platforms()
+        cache_key = (query, threshold)
+        cached_matches = self._platform_match_cache.get(cache_key)
+        if cached_matches is not None:
+            return cached_matches
+        
+        matches = self._score_platforms(query, threshold)
+        self._platform_match_cache[cache_key] = matches
+        return matches
+    
+    def _score_platforms(self, query: str, threshold: float) -> List[Tuple[str, float]]:
+        """
+        Score all platforms against the query (uncached part of fuzzy_match_platform)
+        
+        Args:
+            query: Search query
+            threshold: Minimum similarity score (0-1)
+            
+        Returns:
+            List of (platform_name, score) tuples sorted by score
+        """
+        # Ensure platforms (and their cached lowercased names) are loaded
+        self.get_available_platforms()
         matches = []
         
         query_lower = query.lower()
         
-        for platform in platforms:
-            platform_lower = platform.lower()
-            
+        # A single character can't be fuzzy matched meaningfully - just return
+        # the platforms that start with it (sorted and filtered like the fuzzy
+        # results, so an exact hit comes first)
+        if len(query_lower) < 2:
+            for platform, platform_lower in self._platforms_lower:
+                if platform_lower.startswith(query_lower):
+                    score = 1.0 if query_lower == platform_lower else 0.9
+                    if score >= threshold:
+                        matches.append((platform, score))
+            matches.sort(key=lambda x: x[1], reverse=True)
+            return matches
+        
+        # Platforms that still need a fuzzy score: (platform, lowercased name)
+        candidates = []
+        
+        for platform, platform_lower in self._platforms_lower:
             # Exact match
             if query_lower == platform_lower:
                 matches.append((platform, 1.0))
@@ -869,10 +1328,39 @@ class ArchiveExporter:
                 matches.append((platform, 0.9))
                 continue
             
-            # Fuzzy match using SequenceMatcher
-            ratio = SequenceMatcher(None, query_lower, platform_lower).ratio()
-            if ratio >= threshold:
-                matches.append((platform, ratio))
+            candidates.append((platform, platform_lower))
+        
+        fuzz, process = _load_rapidfuzz()
+        if process is not None:
+            # Score all remaining candidates in one rapidfuzz call (C++ backend)
+            results = process.extract(
+                query_lower,
+                [platform_lower for _, platform_lower in candidates],
+                scorer=fuzz.ratio,
+                score_cutoff=threshold * 100,
+                limit=None
+            )
+            for _, score, idx in results:
+                matches.append((candidates[idx][0], score / 100))
+        else:
+            # Fuzzy match using SequenceMatcher - one matcher is reused with
+            # the query fixed as seq1, only the platform side is swapped in.
+            # ratio() is not symmetric, so the query stays seq1 to keep the
+            # established scores (at the cost of re-indexing seq2 each time)
+            from difflib import SequenceMatcher
+            matcher = SequenceMatcher(None, query_lower)
+            for platform, platform_lower in candidates:
+                matcher.set_seq2(platform_lower)
+                
+                # Cheap upper bounds on ratio() - skip the full match when
+                # they already rule the platform out
+                if (matcher.real_quick_ratio() < threshold
+                        or matcher.quick_ratio() < threshold):
+                    continue
+                
+                ratio = matcher.ratio()
+                if ratio >= threshold:
+                    matches.append((platform, ratio))
         
         # Sort by score descending
         matches.sort(key=lambda x: x[1], reverse=True)
@@ -958,16 +1446,16 @@ class ArchiveExporter:
         platforms = self.get_available_platforms()
         selected_platforms = []
         
-        print(f"\n{'='*70}")
+        print("\n" + _HRULE)
         print(f"Interactive Platform Selection")
         print(f"Total platforms: {len(platforms)}")
-        print(f"{'='*70}")
+        print(_HRULE)
         print("\nFor each platform, choose:")
         print("  y/yes - Export this platform")
         print("  n/no  - Skip this platform")
         print("  a/all - Export all remaining platforms")
         print("  q/quit - Stop and export selected platforms so far")
-        print(f"{'='*70}\n")
+        print(_HRULE + "\n")
         
         for idx, platform in enumerate(platforms, 1):
             print(f"\n[{idx}/{len(platforms)}] {platform}")
@@ -1013,42 +1501,167 @@ class ArchiveExporter:
             self.logger.info(f"Scanning games in platform: {platform_name}")
         
         platform_path = self.source / 'Games' / platform_name
-        if not platform_path.exists():
+        try:
+            # The directory's mtime changes whenever a game is added, removed or renamed
+            dir_mtime_ns = platform_path.stat().st_mtime_ns
+        except OSError:
             self.logger.error(f"Platform directory not found: {platform_path}")
             return []
         
+        # Reuse the scan from a previous run if the directory is unchanged
+        games = self._load_games_cache(platform_name, platform_path, dir_mtime_ns)
+        if games is not None:
+            if self.verbose:
+                self.logger.info(f"  ✓ Found {len(games)} games in {platform_name} (cached scan)")
+            self.platform_games[platform_name] = games
+            return games
+        
         games = []
         file_count = 0
         
-        # Count files first for progress
-        all_items = list(platform_path.iterdir())
+        # Count files first for progress (scandir entries carry the file type
+        # from readdir, so only regular files need a stat() for their size)
+        with os.scandir(platform_path) as scanner:
+            all_items = list(scanner)
         total_items = len(all_items)
         
-        for idx, item in enumerate(all_items, 1):
+        for idx, entry in enumerate(all_items, 1):
             if self.verbose and idx % 100 == 0:
                 self.logger.info(f"  Scanned {idx}/{total_items} items...")
             
-            if item.is_file():
+            if entry.is_file():
+                name, extension = os.path.splitext(entry.name)
                 game_info = {
-                    'name': item.stem,  # Filename without extension
-                    'filename': item.name,
-                    'path': item,
-                    'size': item.stat().st_size,
-                    'extension': item.suffix
+                    'name': name,  # Filename without extension
+                    'name_lower': name.lower(),  # Precomputed for sorting/fuzzy matching
+                    'filename': entry.name,
+                    'path': Path(entry.path),
+                    'size': entry.stat().st_size,
+                    'extension': extension
                 }
                 games.append(game_info)
         
         # Sort by name
         if self.verbose:
             self.logger.info(f"  Sorting {len(games)} games...")
-        games.sort(key=lambda x: x['name'].lower())
+        games.sort(key=lambda x: x['name_lower'])
         
         if self.verbose:
             self.logger.info(f"  ✓ Found {len(games)} games in {platform_name}")
         
+        self._save_games_cache(platform_name, dir_mtime_ns, games)
         self.platform_games[platform_name] = games
         return games
     
+    def prefetch_platform_games(self, platform_names: List[str]):
+        """
+        Scan several platforms' games in parallel (results are cached for
+        scan_platform_games)
+        
+        Args:
+            platform_names: Platforms to scan
+        """
+        pending = [name for name in platform_names if name not in self.platform_games]
+        if len(pending) > 1:
+            self._parallel_map(self.scan_platform_games, pending)
+    
+    @staticmethod
+    def _get_cache_dir() -> Path:
+        """
+        Get the per-user cache directory for this tool
+        
+        Returns:
+            $XDG_CACHE_HOME/lb2es-de, %LOCALAPPDATA%/lb2es-de on Windows,
+            or ~/.cache/lb2es-de
+        """
+        base = os.environ.get('XDG_CACHE_HOME')
+        if not base and sys.platform == 'win32':
+            base = os.environ.get('LOCALAPPDATA')
+        if base:
+            return Path(base).expanduser() / 'lb2es-de'
+        return Path.home() / '.cache' / 'lb2es-de'
+    
+    def _games_cache_file(self, platform_name: str) -> Path:
+        """
+        Get the cache file for a platform's game scan
+        
+        Args:
+            platform_name: Name of the platform
+            
+        Returns:
+            Path to the cache file (named by a hash of archive and platform)
+        """
+        key = f"{os.path.abspath(self.source)}\0{platform_name}".encode('utf-8')
+        return self._games_cache_dir / f"{hashlib.sha1(key).hexdigest()}.json"
+    
+    def _load_games_cache(self, platform_name: str, platform_path: Path,
+                          dir_mtime_ns: int) -> Optional[List[Dict]]:
+        """
+        Load a platform's game list from a previous run's scan
+        
+        Args:
+            platform_name: Name of the platform
+            platform_path: Platform directory in the archive
+            dir_mtime_ns: Current mtime of the platform directory
+            
+        Returns:
+            List of game dictionaries, or None if there is no valid cached scan
+        """
+        if self.refresh_cache:
+            return None
+        
+        try:
+            cached = _json_loads(self._games_cache_file(platform_name).read_bytes())
+            if cached.get('mtime_ns') != dir_mtime_ns:
+                return None
+            
+            games = []
+            for game in cached['games']:
+                games.append({
+                    'name': game['name'],
+                    'name_lower': game['name'].lower(),
+                    'filename': game['filename'],
+                    'path': platform_path / game['filename'],
+                    'size': game['size'],
+                    'extension': game['extension']
+                })
+            return games
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug("Ignoring unreadable games cache for %s: %s", platform_name, e)
+            return None
+    
+    def _save_games_cache(self, platform_name: str, dir_mtime_ns: int, games: List[Dict]):
+        """
+        Save a platform's game list so the next run can skip the scan
+        
+        Args:
+            platform_name: Name of the platform
+            dir_mtime_ns: mtime of the platform directory when it was scanned
+            games: List of game dictionaries
+        """
+        # Dry-run must not create any files
+        if self.dry_run:
+            return
+        
+        cache_data = {
+            'platform': platform_name,
+            'mtime_ns': dir_mtime_ns,
+            'games': [
+                {key: game[key] for key in ('name', 'filename', 'size', 'extension')}
+                for game in games
+            ]
+        }
+        
+        try:
+            cache_file = self._games_cache_file(platform_name)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache_data, f)
+        except OSError as e:
+            self.logger.debug("Could not write games cache for %s: %s", platform_name, e)
+    
     def scan_destination_games(self, platform_name: str) -> List[Dict]:
         """
         Scan games that exist in the destination directory (for backport-only mode)
@@ -1072,32 +1685,36 @@ class ArchiveExporter:
         else:
             platform_dest = self.destination / mapped_platform
         
-        if not platform_dest.exists():
-            self.logger.warning(f"Destination directory does not exist: {platform_dest}")
-            return []
-        
         games = []
         
         if self.verbose:
             self.logger.info(f"  Scanning destination: {platform_dest}")
         
-        # Scan for game files
-        for item in platform_dest.iterdir():
-            # Skip metadata directories
-            if item.is_dir():
-                continue
-            
-            if item.is_file():
-                game_info = {
-                    'name': item.stem,  # Filename without extension
-                    'filename': item.name,
-                    'path': item,  # Points to destination, not archive
-                    'size': item.stat().st_size,
-                    'extension': item.suffix
-                }
-                games.append(game_info)
+        # Scan for game files (a missing directory shows up here, no separate exists())
+        try:
+            scanner = os.scandir(platform_dest)
+        except (FileNotFoundError, NotADirectoryError):
+            self.logger.warning(f"Destination directory does not exist: {platform_dest}")
+            return []
         
-        games.sort(key=lambda x: x['name'].lower())
+        with scanner:
+            for entry in scanner:
+                # Skips metadata directories - is_file() uses the type from readdir,
+                # only symlinks need a stat()
+                if entry.is_file():
+                    # One split gives both the name and the extension
+                    name, extension = os.path.splitext(entry.name)
+                    game_info = {
+                        'name': name,  # Filename without extension
+                        'name_lower': name.lower(),  # Precomputed for sorting/fuzzy matching
+                        'filename': entry.name,
+                        'path': Path(entry.path),  # Points to destination, not archive
+                        'size': None,  # Not needed for backport - saves a stat() per file
+                        'extension': extension
+                    }
+                    games.append(game_info)
+        
+        games.sort(key=lambda x: x['name_lower'])
         
         if self.verbose:
             self.logger.info(f"  ✓ Found {len(games)} games in destination")
@@ -1108,6 +1725,27 @@ class ArchiveExporter:
         """
         Find games matching the query using fuzzy matching
         
+        Args:
+            platform_name: Platform to search in
+            query: Search query
+            threshold: Minimum similarity score (0-1)
+            
+        Returns:
+            List of (game_info, score) tuples sorted by score
+        """
+        cache_key = (platform_name, query, threshold)
+        cached_matches = self._games_match_cache.get(cache_key)
+        if cached_matches is not None:
+            return cached_matches
+        
+        matches = self._score_games(platform_name, query, threshold)
+        self._games_match_cache[cache_key] = matches
+        return matches
+    
+    def _score_games(self, platform_name: str, query: str, threshold: float) -> List[Tuple[Dict, float]]:
+        """
+        Score a platform's games against the query (uncached part of fuzzy_match_games)
+        
         Args:
             platform_name: Platform to search in
             query: Search query
@@ -1121,8 +1759,11 @@ class ArchiveExporter:
         
         query_lower = query.lower()
         
+        # Games that still need a fuzzy score: (game, lowercased name)
+        candidates = []
+        
         for game in games:
-            game_name_lower = game['name'].lower()
+            game_name_lower = game['name_lower']
             
             # Exact match
             if query_lower == game_name_lower:
@@ -1134,11 +1775,40 @@ class ArchiveExporter:
                 matches.append((game, 0.9))
                 continue
             
-            # Fuzzy match
-            ratio = SequenceMatcher(None, query_lower, game_name_lower).ratio()
-            if ratio >= threshold:
-                matches.append((game, ratio))
+            candidates.append((game, game_name_lower))
+        
+        fuzz, process = _load_rapidfuzz()
+        if process is not None:
+            # Score all remaining candidates in one rapidfuzz call (C++ backend)
+            results = process.extract(
+                query_lower,
+                [game_name_lower for _, game_name_lower in candidates],
+                scorer=fuzz.ratio,
+                score_cutoff=threshold * 100,
+                limit=None
+            )
+            for _, score, idx in results:
+                matches.append((candidates[idx][0], score / 100))
+        else:
+            # Fuzzy match - one matcher is reused with the query fixed as seq1
+            # (ratio() is not symmetric, so the orientation matches the
+            # platform matcher and the established scores)
+            from difflib import SequenceMatcher
+            matcher = SequenceMatcher(None, query_lower)
+            for game, game_name_lower in candidates:
+                matcher.set_seq2(game_name_lower)
+                
+                # Cheap upper bounds on ratio() (real_quick_ratio() is the
+                # length bound) - skip games that cannot reach the threshold
+                if (matcher.real_quick_ratio() < threshold
+                        or matcher.quick_ratio() < threshold):
+                    continue
+                
+                ratio = matcher.ratio()
+                if ratio >= threshold:
+                    matches.append((game, ratio))
         
+        # Sort by score descending (merges the exact/contains and fuzzy results)
         matches.sort(key=lambda x: x[1], reverse=True)
         return matches
     
@@ -1208,16 +1878,16 @@ class ArchiveExporter:
             # Interactive mode - step through each game
             selected_games = []
             
-            print(f"\n{'='*70}")
+            print("\n" + _HRULE)
             print(f"Interactive mode: {platform_name}")
             print(f"Total games: {len(games)}")
-            print(f"{'='*70}")
+            print(_HRULE)
             print("\nFor each game, choose:")
             print("  y/yes - Export this game")
             print("  n/no  - Skip this game")
             print("  a/all - Export all remaining games")
             print("  q/quit - Stop and export selected games so far")
-            print(f"{'='*70}\n")
+            print(_HRULE + "\n")
             
             for idx, game in enumerate(games, 1):
                 size_mb = game['size'] / (1024 * 1024)
@@ -1252,7 +1922,8 @@ class ArchiveExporter:
             print(f"Selected all {len(games)} games from {platform_name}")
             return games
     
-    def create_symlink(self, source: Path, destination: Path, force: bool = False) -> bool:
+    def create_symlink(self, source: Path, destination: Path, force: bool = False,
+                       source_size: Optional[int] = None) -> bool:
         """
         Create a symlink or copy from source to destination
         
@@ -1260,6 +1931,8 @@ class ArchiveExporter:
             source: Source file path
             destination: Destination symlink/file path
             force: Whether to overwrite existing files
+            source_size: Size of source from a previous scan (source is then known
+                to be a file and is not stat'ed again)
             
         Returns:
             True if successful, False otherwise
@@ -1267,14 +1940,19 @@ class ArchiveExporter:
         try:
             operation = "symlink" if self.use_symlinks else "copy"
             
-            # Validate source exists
-            if not source.exists():
-                self.logger.error(f"Source file does not exist: {source}")
-                return False
-            
-            if not source.is_file():
-                self.logger.error(f"Source is not a file: {source}")
-                return False
+            # Validate source exists (already known from the scan if size was given).
+            # One stat() answers both questions and gives the size for the copy check.
+            if source_size is None:
+                try:
+                    source_stat = os.stat(source)
+                except (FileNotFoundError, NotADirectoryError):
+                    self.logger.error(f"Source file does not exist: {source}")
+                    return False
+                
+                if not stat.S_ISREG(source_stat.st_mode):
+                    self.logger.error(f"Source is not a file: {source}")
+                    return False
+                source_size = source_stat.st_size
             
             # Dry run mode - simulate without creating
             if self.dry_run:
@@ -1282,55 +1960,64 @@ class ArchiveExporter:
                 if self.verbose:
                     self.logger.info(f"[DRY RUN] Would {operation}: {destination} -> {source}")
                 else:
-                    self.logger.debug(f"[DRY RUN] Would {operation}: {destination.name} -> {source}")
+                    self.logger.debug("[DRY RUN] Would %s: %s -> %s", operation, destination.name, source)
                 
                 # Check if destination would be overwritten
-                if destination.exists() or destination.is_symlink():
+                if os.path.lexists(destination):
                     if force:
-                        self.logger.debug(f"[DRY RUN] Would remove existing file: {destination}")
+                        self.logger.debug("[DRY RUN] Would remove existing file: %s", destination)
                     else:
                         self.logger.warning(f"[DRY RUN] Destination exists (would skip): {destination.name}")
                         return False
                 return True
             
-            # Create parent directories if needed
-            try:
-                destination.parent.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                self.logger.error(f"Failed to create parent directory {destination.parent}: {e}")
-                return False
-            
-            # Check if destination already exists
-            if destination.exists() or destination.is_symlink():
-                if force:
-                    try:
-                        destination.unlink()
-                        self.logger.debug(f"Removed existing file: {destination}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to remove existing file {destination}: {e}")
-                        return False
-                else:
-                    self.logger.warning(f"Destination already exists (skipping): {destination.name}")
+            # Create parent directories if needed (each directory only once per run)
+            parent_dir = destination.parent
+            if parent_dir not in self._created_dirs:
+                try:
+                    parent_dir.mkdir(parents=True, exist_ok=True)
+                except Exception as e:
+                    self.logger.error(f"Failed to create parent directory {parent_dir}: {e}")
                     return False
+                self._created_dirs.add(parent_dir)
+            
+            # When overwriting, the new link/copy is built beside the destination
+            # and swapped in with os.replace() - atomic, and the old file is kept
+            # if anything fails
+            temp_target = destination.with_name(destination.name + '.__tmp')
             
             # Create symlink or copy file
             if self.use_symlinks:
+                target = destination
                 try:
-                    os.symlink(source, destination)
+                    # Link straight away - an existing destination (including a
+                    # broken symlink) shows up as FileExistsError, so there is no
+                    # separate existence check
+                    try:
+                        os.symlink(source, destination)
+                    except FileExistsError:
+                        if not force:
+                            self.logger.warning(f"Destination already exists (skipping): {destination.name}")
+                            return False
+                        target = temp_target
+                        try:
+                            os.symlink(source, target)
+                        except FileExistsError:
+                            # Temp link left behind by an interrupted run
+                            os.unlink(target)
+                            os.symlink(source, target)
+                        os.replace(target, destination)
+                        self.logger.debug("Replaced existing file: %s", destination)
                     
                     # Log with full paths in verbose mode, short names otherwise
                     if self.verbose:
                         self.logger.info(f"Created symlink: {destination} -> {source}")
                     else:
-                        self.logger.debug(f"Created symlink: {destination.name} -> {source}")
+                        self.logger.debug("Created symlink: %s -> %s", destination.name, source)
                     
-                    # Verify symlink was created successfully
-                    if not destination.is_symlink():
-                        self.logger.error(f"Symlink creation reported success but link does not exist: {destination}")
-                        return False
-                    
-                    # Verify symlink points to the correct source
-                    if destination.resolve() != source.resolve():
+                    # Verify symlink points to the correct source (--verify only -
+                    # resolving both sides walks every link in the chain)
+                    if self.verify and destination.resolve() != source.resolve():
                         self.logger.error(
                             f"Symlink created but points to wrong target: "
                             f"{destination.resolve()} != {source.resolve()}"
@@ -1338,45 +2025,50 @@ class ArchiveExporter:
                         return False
                         
                 except OSError as e:
-                    # Check if it's a privilege error on Windows
-                    if e.winerror == 1314:  # ERROR_PRIVILEGE_NOT_HELD
-                        self.logger.error(
-                            f"Symlink creation failed: Insufficient privileges\n"
-                            f"  On Windows, you need either:\n"
-                            f"  1. Run as Administrator, OR\n"
-                            f"  2. Enable Developer Mode (Settings > Update & Security > For Developers)\n"
-                            f"  Alternatively, use --symlink=false to copy files instead"
-                        )
+                    self._remove_temp_file(target, destination)
+                    # winerror only exists on Windows
+                    if getattr(e, 'winerror', None) == 1314:  # ERROR_PRIVILEGE_NOT_HELD
+                        self.logger.error(_SYMLINK_PRIVILEGE_HELP)
                     else:
                         self.logger.error(f"Failed to create symlink {destination}: {e}")
                     return False
             else:
+                # Check if destination already exists (lexists - broken symlinks count too)
+                replace_existing = os.path.lexists(destination)
+                if replace_existing and not force:
+                    self.logger.warning(f"Destination already exists (skipping): {destination.name}")
+                    return False
+                
+                target = temp_target if replace_existing else destination
                 try:
-                    import shutil
-                    shutil.copy2(source, destination)
-                    
-                    # Log with full paths in verbose mode, short names otherwise
-                    if self.verbose:
-                        self.logger.info(f"Copied file: {destination} <- {source}")
-                    else:
-                        self.logger.debug(f"Copied file: {destination.name} <- {source}")
+                    self._copy_file(source, target)
                     
-                    # Verify file was copied successfully
-                    if not destination.exists():
-                        self.logger.error(f"File copy reported success but file does not exist: {destination}")
-                        return False
-                    
-                    # Verify file size matches
-                    source_size = source.stat().st_size
-                    dest_size = destination.stat().st_size
+                    # Verify file size matches (before it replaces an existing file).
+                    # A size from an earlier (possibly cached) scan is re-checked
+                    # against the source before reporting a mismatch.
+                    dest_size = os.stat(target).st_size
+                    if source_size is None or source_size != dest_size:
+                        source_size = source.stat().st_size
                     if source_size != dest_size:
                         self.logger.error(
                             f"File copy size mismatch: source={source_size} bytes, "
                             f"dest={dest_size} bytes for {destination}"
                         )
+                        self._remove_temp_file(target, destination)
                         return False
+                    
+                    if replace_existing:
+                        os.replace(target, destination)
+                        self.logger.debug("Replaced existing file: %s", destination)
+                    
+                    # Log with full paths in verbose mode, short names otherwise
+                    if self.verbose:
+                        self.logger.info(f"Copied file: {destination} <- {source}")
+                    else:
+                        self.logger.debug("Copied file: %s <- %s", destination.name, source)
                         
                 except Exception as e:
+                    self._remove_temp_file(target, destination)
                     self.logger.error(f"Failed to copy file {source} to {destination}: {e}")
                     return False
             
@@ -1386,11 +2078,60 @@ class ArchiveExporter:
             self.logger.error(f"OS Error creating {operation} {destination}: {e}")
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error creating {operation}: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            # logger.exception() attaches the traceback to this one record
+            self.logger.exception("Unexpected error creating %s: %s", operation, e)
             return False
     
+    @staticmethod
+    def _copy_file(source: Path, destination: Path) -> None:
+        """
+        Copy a file with its metadata (like shutil.copy2), letting the kernel
+        clone or copy the data where possible
+        
+        On Linux, os.copy_file_range() keeps the copy in the kernel and makes a
+        copy-on-write reflink on filesystems that support it (Btrfs, XFS).
+        Python 3.14+ does this inside shutil.copyfile() already.
+        
+        Args:
+            source: Source file path
+            destination: Destination file path
+        """
+        if not hasattr(os, 'copy_file_range') or sys.version_info >= (3, 14):
+            shutil.copy2(source, destination)
+            return
+        
+        try:
+            with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                src_fd, dst_fd = src.fileno(), dst.fileno()
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, min(remaining, 1 << 30))
+                    if copied == 0:
+                        break
+                    remaining -= copied
+        except OSError as e:
+            # Not supported for this file/filesystem pair - do a regular copy
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL):
+                raise
+            shutil.copyfile(source, destination)
+        
+        shutil.copystat(source, destination)
+    
+    @staticmethod
+    def _remove_temp_file(target: Path, destination: Path) -> None:
+        """
+        Remove a leftover temporary file from a failed overwrite
+        
+        Args:
+            target: Path that was being written
+            destination: Final destination path (never removed)
+        """
+        if target != destination:
+            try:
+                os.unlink(target)
+            except OSError:
+                pass
+    
     def export_games(self, platform_name: str, games: List[Dict], force: bool = False) -> Dict[str, int]:
         """
         Export selected games for a platform
@@ -1473,41 +2214,110 @@ class ArchiveExporter:
         else:
             platform_dest = self.destination / mapped_platform
         
-        platform_dest.mkdir(parents=True, exist_ok=True)
+        platform_dest.mkdir(parents=True, exist_ok=True)
+        # Every game goes into this directory - create_symlink needn't mkdir it again
+        self._created_dirs.add(platform_dest)
+        
+        dry_run_prefix = "[DRY RUN] " if self.dry_run else ""
+        self.logger.info(f"\n{dry_run_prefix}Exporting {len(games)} games for {platform_name}...")
+        
+        # Destination paths are built once and shared by the workers and the report loop
+        dest_paths = [platform_dest / game['filename'] for game in games]
+        
+        # Playlist entries need absolute ROM paths - make the platform directory
+        # absolute once rather than each game's path (one getcwd() per game)
+        if self.dest_format == 'retroarch':
+            playlist_rom_dir = platform_dest.absolute()
+        
+        # Log records from create_symlink are held back per game and emitted by
+        # the report loop right before that game's status line, so a game's
+        # warnings and its status stay together
+        capture = threading.local()
+        
+        def defer_game_records(record: logging.LogRecord) -> bool:
+            records = getattr(capture, 'records', None)
+            if records is None:
+                return True
+            records.append(record)
+            return False
+        
+        def export_game(idx: int) -> Tuple[bool, List[logging.LogRecord]]:
+            game = games[idx]
+            capture.records = records = []
+            try:
+                created = self.create_symlink(game['path'], dest_paths[idx], force, source_size=game['size'])
+            finally:
+                capture.records = None
+            return created, records
         
-        dry_run_prefix = "[DRY RUN] " if self.dry_run else ""
-        self.logger.info(f"\n{dry_run_prefix}Exporting {len(games)} games for {platform_name}...")
+        # Per-game status lines are written in batches (one write per 256 games);
+        # verbose mode prints them immediately alongside the progress log
+        status_lines = []
         
-        for idx, game in enumerate(games, 1):
-            # Show progress indicator
+        def report_status(line: str):
             if self.verbose:
-                self.logger.info(f"[{idx}/{len(games)}] Processing: {game['name']}")
-            
-            source_path = game['path']
-            dest_path = platform_dest / game['filename']
+                print(line)
+                return
+            status_lines.append(line + "\n")
+            if len(status_lines) >= 256:
+                sys.stdout.write("".join(status_lines))
+                status_lines.clear()
+        
+        self.logger.addFilter(defer_game_records)
+        try:
+            # Symlinks/copies are I/O bound, so create them on worker threads up front.
+            # Results come back in game order and are reported below; playlist updates
+            # stay on this thread. Dry-run stays sequential for readable log output.
+            results = None if self.dry_run else self._parallel_map(export_game, range(len(games)))
             
-            if self.create_symlink(source_path, dest_path, force):
-                stats['success'] += 1
-                stats['total_size'] += game['size']
-                stats['games_for_metadata'].append(game)  # Track for metadata export
-                
-                # Add to RetroArch playlist if applicable
-                if self.dest_format == 'retroarch' and not self.dry_run:
-                    self.add_game_to_retroarch_playlist(mapped_platform, game, dest_path)
+            for idx, game in enumerate(games, 1):
+                # Show progress indicator
+                if self.verbose:
+                    self.logger.info(f"[{idx}/{len(games)}] Processing: {game['name']}")
                 
-                print(f"  ✓ {game['name']}")
-            elif dest_path.exists() and not self.dry_run:
-                stats['skipped'] += 1
-                stats['games_for_metadata'].append(game)  # Also check metadata for existing games
+                dest_path = dest_paths[idx - 1]
+                created, records = export_game(idx - 1) if results is None else results[idx - 1]
                 
-                # Add to RetroArch playlist if applicable (even if game already exists)
-                if self.dest_format == 'retroarch':
-                    self.add_game_to_retroarch_playlist(mapped_platform, game, dest_path)
+                # Emit the game's held-back log records (after any batched status
+                # lines of earlier games, which are written first)
+                if records:
+                    if status_lines:
+                        sys.stdout.write("".join(status_lines))
+                        status_lines.clear()
+                    for record in records:
+                        self.logger.handle(record)
                 
-                print(f"  ⊘ {game['name']} (already exists)")
-            else:
-                stats['failed'] += 1
-                print(f"  ✗ {game['name']} (failed)")
+                if created:
+                    stats['success'] += 1
+                    stats['total_size'] += game['size']
+                    stats['games_for_metadata'].append(game)  # Track for metadata export
+                    
+                    # Add to RetroArch playlist if applicable
+                    if self.dest_format == 'retroarch' and not self.dry_run:
+                        self.add_game_to_retroarch_playlist(mapped_platform, game, playlist_rom_dir / game['filename'])
+                    
+                    report_status(f"  ✓ {game['name']}")
+                elif dest_path.exists() and not self.dry_run:
+                    stats['skipped'] += 1
+                    stats['games_for_metadata'].append(game)  # Also check metadata for existing games
+                    
+                    # Add to RetroArch playlist if applicable (even if game already exists)
+                    if self.dest_format == 'retroarch':
+                        self.add_game_to_retroarch_playlist(mapped_platform, game, playlist_rom_dir / game['filename'])
+                    
+                    report_status(f"  ⊘ {game['name']} (already exists)")
+                else:
+                    stats['failed'] += 1
+                    report_status(f"  ✗ {game['name']} (failed)")
+        finally:
+            self.logger.removeFilter(defer_game_records)
+        
+        if status_lines:
+            sys.stdout.write("".join(status_lines))
+        
+        # One playlist write for the whole platform
+        if self.dest_format == 'retroarch':
+            self.flush_retroarch_playlists()
         
         return stats
     
@@ -1528,19 +2338,12 @@ class ArchiveExporter:
         if not metadata_base.exists():
             return []
         
-        matching_files = []
-        
-        # Search recursively for files matching the game name
-        for file_path in metadata_base.rglob('*'):
-            if file_path.is_file():
-                # Check if filename starts with game name
-                if file_path.stem.startswith(game_name):
-                    matching_files.append(file_path)
-        
-        return matching_files
+        # Search recursively for files whose name starts with the game name
+        index = self._get_metadata_index(metadata_base, recursive=True)
+        return self._lookup_metadata_prefix(index, game_name)
     
     def export_metadata(self, platform_name: str, games: List[Dict], 
-                       metadata_types: Optional[List[str]] = None, 
+                       metadata_types: Optional[AbstractSet[str]] = None, 
                        force: bool = False) -> Dict[str, int]:
         """
         Export metadata for selected games using format-specific metadata mappings
@@ -1548,7 +2351,7 @@ class ArchiveExporter:
         Args:
             platform_name: Platform name (from master archive)
             games: List of game info dictionaries
-            metadata_types: List of metadata types to export (deprecated - uses mappings now)
+            metadata_types: Set of metadata types to export (deprecated - uses mappings now)
             force: Whether to overwrite existing files
             
         Returns:
@@ -1581,75 +2384,139 @@ class ArchiveExporter:
         # Pre-scan all metadata paths and prompt for subdirectory selections once
         self._prescan_metadata_subdirectories(platform_name)
         
+        if not games:
+            return stats
+        
         # Track unmapped directories we encounter
         unmapped_dirs = set()
         
-        # Progress tracking
-        total_mappings = len([m for m in metadata_mappings.items() if m[1] is not None])
-        current_mapping = 0
+        # List the platform's metadata directories once (one scandir per type) -
+        # answers both the per-mapping existence checks and the unmapped report
+        metadata_types_to_list = list(dict.fromkeys(
+            ['Images', 'Videos', 'Manuals', 'Music'] +
+            [mapping[2] for mapping in self._parsed_metadata_mappings]
+        ))
+        platform_dirs = self._list_platform_metadata_dirs(platform_name, metadata_types_to_list)
+        
+        # Resolve everything that depends only on the mapping (source directory,
+        # subdirectory selection, destination naming) once, not once per game
+        mapping_plan = []
+        for archive_path, dest_name, metadata_type, subdir, stats_key in self._parsed_metadata_mappings:
+            # Build the source path
+            if subdir:
+                # Has subdirectory (e.g., Images/Box - Front)
+                metadata_base = self.source / 'Metadata' / metadata_type / platform_name / subdir
+            else:
+                # No subdirectory (e.g., Videos, Manuals)
+                metadata_base = self.source / 'Metadata' / metadata_type / platform_name
+            
+            if self.verbose:
+                self.logger.info(f"  Checking: {archive_path}")
+                self.logger.info(f"    → Source: {metadata_base}")
+            
+            # Check if this metadata directory exists
+            if not self._metadata_dir_exists(platform_dirs, metadata_type, subdir, metadata_base):
+                self.logger.debug("Metadata directory not found: %s", metadata_base)
+                unmapped_dirs.add(archive_path)
+                if self.verbose:
+                    self.logger.info(f"    ✗ Directory not found")
+                continue
+            
+            # Check for subdirectories (e.g., regional variants like Europe, North America)
+            # or architectural variants (Cocktail, Upright)
+            subdirs_available = self._get_metadata_subdirectories(metadata_base)
+            selected_subdirs = None
+            
+            if subdirs_available:
+                if self.verbose:
+                    self.logger.info(f"    → Found {len(subdirs_available)} subdirectory(ies)")
+                # Prompt user to select which subdirectories to use
+                selected_subdirs = self._select_metadata_subdirectories(subdirs_available, archive_path)
+            
+            # Parse the destination name which now includes subdirectory
+            # e.g., "images/box2dfront" or "videos/video"
+            if '/' in dest_name:
+                # New format: "subdir/prefix"
+                dest_parts = dest_name.split('/')
+                metadata_subdir = dest_parts[0]
+                filename_prefix = dest_parts[1]
+            else:
+                # Legacy format: just "prefix" - fall back to metadata_subdirs or lowercase
+                metadata_subdirs = self.format_config.get('metadata_subdirs', {})
+                metadata_subdir = metadata_subdirs.get(metadata_type, metadata_type.lower())
+                filename_prefix = dest_name
+            
+            # Destination directory for this mapping
+            if self._metadata_base:
+                # Use custom metadata path (e.g., ~/ES-DE/downloaded_media)
+                dest_dir = self._metadata_base / mapped_platform / metadata_subdir
+            elif self.format_config['metadata_subdir']:
+                # Metadata within ROM directory
+                roms_base = self.format_config.get('roms_path', '')
+                if roms_base:
+                    dest_dir = self.destination / roms_base / mapped_platform / metadata_subdir
+                else:
+                    dest_dir = self.destination / mapped_platform / metadata_subdir
+            else:
+                # Separate metadata structure
+                dest_dir = self.destination / 'metadata' / mapped_platform / metadata_subdir
+            
+            mapping_plan.append((archive_path, dest_name, metadata_type, stats_key, metadata_base,
+                                 selected_subdirs, filename_prefix, dest_dir))
+        
+        # Archive directories the format has no mapping for (only reported when
+        # some mapped directory was missing)
+        unmapped_archive_paths = []
+        if unmapped_dirs:
+            for metadata_type in ['Images', 'Videos', 'Manuals', 'Music']:
+                for subdir_name in sorted(platform_dirs[metadata_type] or ()):
+                    archive_path = f"{metadata_type}/{subdir_name}"
+                    if archive_path not in metadata_mappings:
+                        unmapped_archive_paths.append(archive_path)
+        
+        # Check if metadata should be renamed to match ROM filename
+        rename_to_match = self.format_config.get('rename_metadata_to_match_rom', False)
+        
+        # No metadata directories for this platform - nothing to look up per game
+        if not mapping_plan:
+            games = []
+        
+        # Index every directory the games are looked up in up front, in parallel -
+        # each listing is a round-trip to the archive share, and the per-game loop
+        # below then only reads the cached indexes
+        if games:
+            search_dirs = []
+            for plan in mapping_plan:
+                metadata_base, selected_subdirs = plan[4], plan[5]
+                if selected_subdirs:
+                    search_dirs.extend(metadata_base / subdir for subdir in selected_subdirs)
+                else:
+                    search_dirs.append(metadata_base)
+            self._parallel_map(self._get_metadata_index, list(dict.fromkeys(search_dirs)))
+        
+        # Links/copies to create {destination: [(source, stats key), ...]} - several
+        # mappings can target the same destination file, so those stay in order
+        link_jobs: Dict[Path, List[Tuple[Path, str]]] = {}
         
+        next_progress = 0.0
         for game_idx, game in enumerate(games, 1):
             game_name = game['name']
             
             # Show game progress
             if self.verbose:
-                self.logger.info(f"\n{'='*70}")
+                self.logger.info("\n" + _HRULE)
                 self.logger.info(f"[Game {game_idx}/{len(games)}] {game_name}")
-                self.logger.info(f"{'='*70}")
-            elif game_idx % 10 == 0 or game_idx == len(games):
-                # Show periodic progress for non-verbose mode
-                print(f"  → Processing game {game_idx}/{len(games)}...", end='\r')
+                self.logger.info(_HRULE)
+            elif game_idx == len(games) or time.monotonic() >= next_progress:
+                # Show rate-limited progress for non-verbose mode
+                print(f"  → Processing game {game_idx}/{len(games)}...", end='\r', flush=True)
+                next_progress = time.monotonic() + _PROGRESS_INTERVAL
             
             # Process each metadata mapping
-            for archive_path, dest_name in metadata_mappings.items():
-                # Skip if destination is null (explicitly not supported)
-                if dest_name is None:
-                    continue
-                
-                if self.verbose:
-                    self.logger.info(f"  Checking: {archive_path}")
-                
-                # Parse archive path (e.g., "Images/Box - Front" or "Videos")
-                path_parts = archive_path.split('/')
-                metadata_type = path_parts[0]  # Images, Videos, Manuals, Music
-                
-                # Build the source path
-                if len(path_parts) > 1:
-                    # Has subdirectory (e.g., Images/Box - Front)
-                    subdir = '/'.join(path_parts[1:])
-                    metadata_base = self.source / 'Metadata' / metadata_type / platform_name / subdir
-                else:
-                    # No subdirectory (e.g., Videos, Manuals)
-                    metadata_base = self.source / 'Metadata' / metadata_type / platform_name
-                
-                if self.verbose:
-                    self.logger.info(f"    → Source: {metadata_base}")
-                
-                # Check if this metadata directory exists
-                if not metadata_base.exists():
-                    if archive_path not in unmapped_dirs:
-                        self.logger.debug(f"Metadata directory not found: {metadata_base}")
-                        unmapped_dirs.add(archive_path)
-                    if self.verbose:
-                        self.logger.info(f"    ✗ Directory not found")
-                    continue
-                
-                # Check for subdirectories (e.g., regional variants like Europe, North America)
-                # or architectural variants (Cocktail, Upright)
-                if self.verbose:
-                    self.logger.info(f"    → Checking for subdirectories...")
-                
-                subdirs_available = self._get_metadata_subdirectories(metadata_base)
-                selected_subdirs = None
-                
-                if subdirs_available:
-                    if self.verbose:
-                        self.logger.info(f"    → Found {len(subdirs_available)} subdirectory(ies)")
-                    # Prompt user to select which subdirectories to use
-                    selected_subdirs = self._select_metadata_subdirectories(subdirs_available, archive_path)
-                
+            for (archive_path, dest_name, metadata_type, stats_key, metadata_base,
+                 selected_subdirs, filename_prefix, dest_dir) in mapping_plan:
                 if self.verbose:
-                    self.logger.info(f"    → Searching for files matching: {game_name}...")
+                    self.logger.info(f"    → Searching {archive_path} for files matching: {game_name}...")
                 
                 # Find matching files for this game (with video filtering for Videos type)
                 matching_files = self._find_metadata_files(metadata_base, game_name, metadata_type, selected_subdirs)
@@ -1687,28 +2554,12 @@ class ArchiveExporter:
                 if self.verbose:
                     self.logger.info(f"    → Building destination path...")
                 
-                # Build destination path
-                # Parse the destination name which now includes subdirectory
-                # e.g., "images/box2dfront" or "videos/video"
-                if '/' in dest_name:
-                    # New format: "subdir/prefix"
-                    dest_parts = dest_name.split('/')
-                    metadata_subdir = dest_parts[0]
-                    filename_prefix = dest_parts[1]
-                else:
-                    # Legacy format: just "prefix" - fall back to metadata_subdirs or lowercase
-                    metadata_subdirs = self.format_config.get('metadata_subdirs', {})
-                    metadata_subdir = metadata_subdirs.get(metadata_type, metadata_type.lower())
-                    filename_prefix = dest_name
-                
-                # Check if metadata should be renamed to match ROM filename
-                rename_to_match = self.format_config.get('rename_metadata_to_match_rom', False)
-                
+                # Build destination filename
                 if rename_to_match:
                     # ES-DE style: Use ROM filename with metadata file extension
                     # e.g., "Super Mario Bros.nes" -> "Super Mario Bros.png"
                     rom_filename = game.get('filename', game_name)  # Get actual ROM filename
-                    rom_name_without_ext = Path(rom_filename).stem  # Remove ROM extension
+                    rom_name_without_ext = os.path.splitext(rom_filename)[0]  # Remove ROM extension
                     dest_filename = f"{rom_name_without_ext}{selected_file.suffix}"
                     if self.verbose:
                         self.logger.info(f"    → Renaming to match ROM: {rom_filename} -> {dest_filename}")
@@ -1717,58 +2568,48 @@ class ArchiveExporter:
                     # e.g., "mario-box2dfront.png" or "mario-video.mp4"
                     dest_filename = f"{game_name}-{filename_prefix}{selected_file.suffix}"
                 
-                # Check if there's a custom metadata path (e.g., for AppImage/Flatpak)
-                metadata_base_path = self.format_config.get('metadata_path')
-                
-                if metadata_base_path:
-                    # Use custom metadata path (e.g., ~/ES-DE/downloaded_media)
-                    metadata_base_expanded = Path(metadata_base_path).expanduser()
-                    dest_path = metadata_base_expanded / mapped_platform / metadata_subdir / dest_filename
-                elif self.format_config['metadata_subdir']:
-                    # Metadata within ROM directory
-                    roms_base = self.format_config.get('roms_path', '')
-                    if roms_base:
-                        dest_path = self.destination / roms_base / mapped_platform / metadata_subdir / dest_filename
-                    else:
-                        dest_path = self.destination / mapped_platform / metadata_subdir / dest_filename
-                else:
-                    # Separate metadata structure
-                    dest_path = self.destination / 'metadata' / mapped_platform / metadata_subdir / dest_filename
+                dest_path = dest_dir / dest_filename
                 
                 if self.verbose:
                     self.logger.info(f"    → Destination: {dest_path}")
-                    self.logger.info(f"    → Creating {'symlink' if self.use_symlinks else 'copy'}...")
                 
-                # Create symlink/copy
-                if self.create_symlink(selected_file, dest_path, force):
-                    stats[metadata_type.lower()] += 1
-                    stats['total'] += 1
-                    if self.verbose:
-                        self.logger.info(f"    ✓ Success")
-                elif self.verbose:
-                    self.logger.info(f"    ⊘ Skipped (already exists or failed)")
+                # Symlink/copy is created once all selections are made (below)
+                link_jobs.setdefault(dest_path, []).append((selected_file, stats_key))
         
         # Clear progress line
         if not self.verbose:
             print(" " * 80, end='\r')  # Clear the progress line
         
+        def create_links(dest_path: Path) -> List[bool]:
+            # Jobs for one destination run in order, so the first mapping wins
+            # (or, with --force, the last one) as when they ran one by one
+            return [self.create_symlink(source, dest_path, force) for source, _ in link_jobs[dest_path]]
+        
+        # Symlinks/copies are I/O bound, so create them on worker threads.
+        # Dry-run stays sequential for readable log output.
+        dest_paths = list(link_jobs)
+        if self.dry_run:
+            results = [create_links(dest_path) for dest_path in dest_paths]
+        else:
+            results = self._parallel_map(create_links, dest_paths)
+        
+        for dest_path, created_list in zip(dest_paths, results):
+            for (_, stats_key), created in zip(link_jobs[dest_path], created_list):
+                if created:
+                    stats[stats_key] += 1
+                    stats['total'] += 1
+                    if self.verbose:
+                        self.logger.info(f"    ✓ {'Linked' if self.use_symlinks else 'Copied'}: {dest_path.name}")
+                elif self.verbose:
+                    self.logger.info(f"    ⊘ Skipped (already exists or failed): {dest_path.name}")
+        
         # Report any unmapped directories we found
-        if unmapped_dirs:
-            # Find directories that exist but aren't mapped
-            metadata_base_path = self.source / 'Metadata'
-            if metadata_base_path.exists():
-                for metadata_type in ['Images', 'Videos', 'Manuals', 'Music']:
-                    type_path = metadata_base_path / metadata_type / platform_name
-                    if type_path.exists():
-                        for subdir in type_path.iterdir():
-                            if subdir.is_dir():
-                                archive_path = f"{metadata_type}/{subdir.name}"
-                                if archive_path not in metadata_mappings:
-                                    self.logger.info(
-                                        f"Skipping unmapped metadata directory: {archive_path} "
-                                        f"(not supported by {self.dest_format})"
-                                    )
-                                    stats['skipped_unmapped'] += 1
+        for archive_path in unmapped_archive_paths:
+            self.logger.info(
+                f"Skipping unmapped metadata directory: {archive_path} "
+                f"(not supported by {self.dest_format})"
+            )
+            stats['skipped_unmapped'] += 1
         
         return stats
     
@@ -1782,8 +2623,6 @@ class ArchiveExporter:
         Returns:
             CRC32 checksum as hex string
         """
-        import zlib
-        
         crc = 0
         with open(file_path, 'rb') as f:
             while True:
@@ -1858,18 +2697,9 @@ class ArchiveExporter:
         for game in games:
             game_name = game['name']
             
-            for archive_path, dest_name in metadata_mappings.items():
-                # Skip if destination is null (not supported)
-                if dest_name is None:
-                    continue
-                
-                # Parse paths
-                path_parts = archive_path.split('/')
-                metadata_type = path_parts[0]
-                
+            for archive_path, dest_name, metadata_type, subdir, stats_key in self._parsed_metadata_mappings:
                 # Determine archive metadata path structure
-                if len(path_parts) > 1:
-                    subdir = '/'.join(path_parts[1:])
+                if subdir:
                     archive_metadata_dir = self.source / 'Metadata' / metadata_type / platform_name / subdir
                 else:
                     archive_metadata_dir = self.source / 'Metadata' / metadata_type / platform_name
@@ -1883,8 +2713,6 @@ class ArchiveExporter:
                 dest_prefix = dest_parts[1]
                 
                 # Determine destination metadata file path
-                metadata_base_path = self.format_config.get('metadata_path')
-                
                 if self.format_config.get('rename_metadata_to_match_rom'):
                     # Metadata uses ROM filename
                     dest_filename_base = game['filename'].rsplit('.', 1)[0]
@@ -1892,10 +2720,9 @@ class ArchiveExporter:
                     # Metadata uses game name with prefix
                     dest_filename_base = f"{game_name}-{dest_prefix}"
                 
-                if metadata_base_path:
+                if self._metadata_base:
                     # Separate metadata location
-                    metadata_base_expanded = Path(metadata_base_path).expanduser()
-                    dest_metadata_dir = metadata_base_expanded / mapped_platform / metadata_subdir
+                    dest_metadata_dir = self._metadata_base / mapped_platform / metadata_subdir
                 else:
                     # Metadata in ROM subdirectories
                     if self.format_config.get('metadata_subdir'):
@@ -1909,15 +2736,17 @@ class ArchiveExporter:
                         self.logger.debug(f"Unsupported metadata structure for backport")
                         continue
                 
-                if not dest_metadata_dir.exists():
+                # Look for destination metadata files (match the name before
+                # is_file(), so only candidates can cost a stat())
+                try:
+                    with os.scandir(dest_metadata_dir) as scanner:
+                        dest_files = [
+                            Path(entry.path) for entry in scanner
+                            if os.path.splitext(entry.name)[0] == dest_filename_base and entry.is_file()
+                        ]
+                except (FileNotFoundError, NotADirectoryError):
                     continue
                 
-                # Look for destination metadata files
-                dest_files = []
-                for dest_file in dest_metadata_dir.iterdir():
-                    if dest_file.is_file() and dest_file.stem == dest_filename_base:
-                        dest_files.append(dest_file)
-                
                 if not dest_files:
                     continue
                 
@@ -1943,24 +2772,29 @@ class ArchiveExporter:
                     
                     if file_exists or (archive_metadata_dir.exists() and not self.dry_run):
                         # Check all existing files in the archive directory for this game
-                        if archive_metadata_dir.exists():
-                            for existing_file in archive_metadata_dir.iterdir():
-                                if not existing_file.is_file():
-                                    continue
-                                
-                                # Check if filename starts with game name and has same extension
-                                if existing_file.stem.startswith(game_name) and existing_file.suffix == dest_file.suffix:
-                                    if not self.dry_run:
-                                        existing_crc = self._calculate_file_crc32(existing_file)
-                                        
-                                        if existing_crc == dest_crc:
-                                            # File with same CRC already exists - skip
-                                            duplicate_found = True
-                                            duplicate_files.append(dest_file.name)
-                                            stats['duplicates_skipped'] += 1
-                                            if self.verbose:
-                                                self.logger.info(f"  ⊘ Duplicate (CRC match): {dest_file.name} = {existing_file.name}")
-                                            break
+                        try:
+                            with os.scandir(archive_metadata_dir) as scanner:
+                                existing_files = [
+                                    Path(entry.path) for entry in scanner
+                                    if entry.name.startswith(game_name) and entry.is_file()
+                                ]
+                        except (FileNotFoundError, NotADirectoryError):
+                            existing_files = []
+                        
+                        for existing_file in existing_files:
+                            # Check if filename starts with game name and has same extension
+                            if existing_file.stem.startswith(game_name) and existing_file.suffix == dest_file.suffix:
+                                if not self.dry_run:
+                                    existing_crc = self._calculate_file_crc32(existing_file)
+                                    
+                                    if existing_crc == dest_crc:
+                                        # File with same CRC already exists - skip
+                                        duplicate_found = True
+                                        duplicate_files.append(dest_file.name)
+                                        stats['duplicates_skipped'] += 1
+                                        if self.verbose:
+                                            self.logger.info(f"  ⊘ Duplicate (CRC match): {dest_file.name} = {existing_file.name}")
+                                        break
                     
                     if duplicate_found:
                         continue
@@ -1987,14 +2821,17 @@ class ArchiveExporter:
                         backported_files.append(archive_dest.name)
                     else:
                         try:
-                            import shutil
-                            shutil.copy2(dest_file, archive_dest)
+                            # A real copy - a hard link would let the frontend's
+                            # in-place rewrites of its file change the archive too
+                            self._copy_file(dest_file, archive_dest)
+                            # Directory contents changed - drop its cached metadata index
+                            self._metadata_index.pop((str(archive_metadata_dir), False), None)
                             if archive_dest.name != base_archive_filename:
                                 self.logger.info(f"  ✓ Backported (renamed): {archive_dest.name}")
                             else:
                                 self.logger.info(f"  ✓ Backported: {archive_dest.name}")
                             backported_files.append(archive_dest.name)
-                            stats[metadata_type.lower()] += 1
+                            stats[stats_key] += 1
                             stats['total'] += 1
                         except Exception as e:
                             self.logger.error(f"  ✗ Failed to backport {dest_file.name}: {e}")
@@ -2042,14 +2879,12 @@ class ArchiveExporter:
         Returns:
             List of subdirectory names
         """
-        subdirs = []
-        
-        if not base_path.exists():
-            return subdirs
-        
-        for item in base_path.iterdir():
-            if item.is_dir():
-                subdirs.append(item.name)
+        # DirEntry.is_dir() uses the type returned by readdir (no stat() per entry)
+        try:
+            with os.scandir(base_path) as scanner:
+                subdirs = [entry.name for entry in scanner if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
         
         return sorted(subdirs)
     
@@ -2077,46 +2912,43 @@ class ArchiveExporter:
         
         self.logger.info(f"\nScanning all platforms for metadata subdirectories...")
         
-        # Collect ALL unique subdirectories across all platforms and metadata types
-        all_subdirs = set()
-        platforms_checked = 0
-        
         # Get all available platforms from the Games directory
         games_dir = self.source / 'Games'
         if not games_dir.exists():
             self.metadata_subdirs_scanned = True
             return
         
-        platforms = [p.name for p in games_dir.iterdir() if p.is_dir()]
+        # Same scandir-based (and cached) listing the platform selection uses
+        platforms = self.get_available_platforms()
+        mapped_types = list(dict.fromkeys(mapping[2] for mapping in self._parsed_metadata_mappings))
         
-        for platform_name in platforms:
-            platforms_checked += 1
-            if platforms_checked % 10 == 0:
-                print(f"  Scanning platform {platforms_checked}/{len(platforms)}...", end='\r')
+        def scan_platform(platform_name: str) -> set:
+            # One listing per metadata type instead of an exists() per mapping
+            platform_dirs = self._list_platform_metadata_dirs(platform_name, mapped_types)
+            platform_subdirs = set()
             
-            for archive_path, dest_name in metadata_mappings.items():
-                # Skip if destination is null
-                if dest_name is None:
-                    continue
-                
-                # Parse archive path (e.g., "Images/Box - Front" or "Videos")
-                path_parts = archive_path.split('/')
-                metadata_type = path_parts[0]
-                
+            for archive_path, dest_name, metadata_type, subdir, stats_key in self._parsed_metadata_mappings:
                 # Build the source path
-                if len(path_parts) > 1:
-                    subdir = '/'.join(path_parts[1:])
+                if subdir:
                     metadata_base = self.source / 'Metadata' / metadata_type / platform_name / subdir
                 else:
                     metadata_base = self.source / 'Metadata' / metadata_type / platform_name
                 
                 # Check if directory exists
-                if not metadata_base.exists():
+                if not self._metadata_dir_exists(platform_dirs, metadata_type, subdir, metadata_base):
                     continue
                 
-                # Get subdirectories and add to global set
-                subdirs = self._get_metadata_subdirectories(metadata_base)
-                all_subdirs.update(subdirs)
+                # Get subdirectories and add to the platform's set
+                platform_subdirs.update(self._get_metadata_subdirectories(metadata_base))
+            return platform_subdirs
+        
+        print(f"  Scanning {len(platforms)} platform(s)...", end='\r', flush=True)
+        
+        # The scan is bound by directory-listing latency on the NFS mount, so
+        # list the platforms concurrently to overlap the round-trips
+        all_subdirs = set()
+        for platform_subdirs in self._parallel_map(scan_platform, platforms):
+            all_subdirs.update(platform_subdirs)
         
         print()  # Clear the progress line
         
@@ -2124,9 +2956,9 @@ class ArchiveExporter:
         if all_subdirs:
             subdirs_sorted = sorted(all_subdirs)
             
-            print(f"\n{'='*70}")
+            print("\n" + _HRULE)
             print(f"GLOBAL METADATA SUBDIRECTORY SELECTION")
-            print(f"{'='*70}")
+            print(_HRULE)
             print(f"Found {len(subdirs_sorted)} unique subdirectory(ies) across all platforms:")
             for i, subdir in enumerate(subdirs_sorted, 1):
                 print(f"  {i}. {subdir}")
@@ -2138,7 +2970,7 @@ class ArchiveExporter:
             print(f"  Enter numbers (comma-separated) to select specific subdirectories")
             print(f"  a - Select all subdirectories")
             print(f"  n - Skip subdirectories (search base directories only)")
-            print(f"{'='*70}")
+            print(_HRULE)
             
             while True:
                 choice = input(f"\nSelect subdirectories [1-{len(subdirs_sorted)}/a/n]: ").strip().lower()
@@ -2175,6 +3007,54 @@ class ArchiveExporter:
         
         self.metadata_subdirs_scanned = True
     
+    def _list_platform_metadata_dirs(self, platform_name: str, metadata_types: List[str]) -> Dict[str, Optional[set]]:
+        """
+        List a platform's metadata directories with one scandir per metadata type
+        
+        Args:
+            platform_name: Platform name (from master archive)
+            metadata_types: Metadata types to list (e.g., 'Images', 'Videos')
+            
+        Returns:
+            Dictionary of metadata type -> set of subdirectory names, or None if
+            the platform has no directory for that type
+        """
+        listing = {}
+        for metadata_type in metadata_types:
+            type_path = self.source / 'Metadata' / metadata_type / platform_name
+            try:
+                with os.scandir(type_path) as scanner:
+                    listing[metadata_type] = {entry.name for entry in scanner if entry.is_dir()}
+            except OSError:
+                listing[metadata_type] = None
+        return listing
+    
+    @staticmethod
+    def _metadata_dir_exists(platform_dirs: Dict[str, Optional[set]], metadata_type: str,
+                             subdir: Optional[str], metadata_base: Path) -> bool:
+        """
+        Check whether a mapping's metadata directory exists for a platform
+        
+        Args:
+            platform_dirs: Listing from _list_platform_metadata_dirs
+            metadata_type: Metadata type of the mapping (e.g., 'Images')
+            subdir: Mapping subdirectory (e.g., 'Box - Front'), or None
+            metadata_base: Full path of the mapping's directory
+            
+        Returns:
+            True if the directory exists, False otherwise
+        """
+        type_subdirs = platform_dirs[metadata_type]
+        if type_subdirs is None:
+            return False
+        if not subdir:
+            return True
+        # The listing only holds the first level - nested mappings (e.g. 'a/b')
+        # are checked on disk
+        if '/' in subdir or '\\' in subdir:
+            return metadata_base.is_dir()
+        return subdir in type_subdirs
+    
     def _prescan_metadata_subdirectories(self, platform_name: str) -> None:
         """
         Ensure the global metadata subdirectory scan has been performed.
@@ -2241,40 +3121,93 @@ class ArchiveExporter:
         """
         matching_files = []
         
-        if not base_path.exists():
-            return matching_files
-        
-        # Determine which directories to search
-        search_paths = []
+        # Determine which directories to search (missing ones index as empty,
+        # so no per-game existence checks are needed)
         if subdirs:
             # Search specified subdirectories
-            for subdir in subdirs:
-                subdir_path = base_path / subdir
-                if subdir_path.exists() and subdir_path.is_dir():
-                    search_paths.append(subdir_path)
+            search_paths = [base_path / subdir for subdir in subdirs]
         else:
             # Search base directory only
-            search_paths.append(base_path)
+            search_paths = [base_path]
         
-        # Search for files in the determined paths
+        # Search for files in the determined paths (each directory is listed once
+        # and then looked up by filename prefix for every game)
         for search_path in search_paths:
-            for file_path in search_path.iterdir():
-                if file_path.is_file():
-                    # Check if filename starts with game name
-                    if file_path.stem.startswith(game_name):
-                        # For Videos metadata, only include actual video files
-                        if metadata_type == "Videos":
-                            if self._is_video_file(file_path):
-                                matching_files.append(file_path)
-                            else:
-                                self.logger.debug(
-                                    f"Skipping non-video file in Videos directory: {file_path.name}"
-                                )
-                        else:
-                            matching_files.append(file_path)
+            index = self._get_metadata_index(search_path)
+            for file_path in self._lookup_metadata_prefix(index, game_name):
+                # For Videos metadata, only include actual video files
+                if metadata_type == "Videos":
+                    if self._is_video_file(file_path):
+                        matching_files.append(file_path)
+                    else:
+                        self.logger.debug(
+                            "Skipping non-video file in Videos directory: %s", file_path.name
+                        )
+                else:
+                    matching_files.append(file_path)
         
         return matching_files
     
+    def _get_metadata_index(self, directory: Path, recursive: bool = False) -> Tuple[List[str], List[str]]:
+        """
+        Get the files in a metadata directory, sorted by filename stem (cached)
+        
+        Args:
+            directory: Directory to index
+            recursive: Whether to include files in subdirectories
+            
+        Returns:
+            Tuple of (sorted stems, file path strings in the same order) - empty
+            if the directory does not exist
+        """
+        cache_key = (str(directory), recursive)
+        index = self._metadata_index.get(cache_key)
+        if index is not None:
+            return index
+        
+        files = []
+        if recursive:
+            for dirpath, _, filenames in os.walk(directory):
+                for filename in filenames:
+                    file_path = os.path.join(dirpath, filename)
+                    if os.path.isfile(file_path):
+                        files.append((os.path.splitext(filename)[0], file_path))
+        else:
+            try:
+                with os.scandir(directory) as scanner:
+                    for entry in scanner:
+                        if entry.is_file():
+                            files.append((os.path.splitext(entry.name)[0], entry.path))
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+        
+        # Paths stay strings here - only the few that match a game become Path objects
+        files.sort()
+        index = ([stem for stem, _ in files], [file_path for _, file_path in files])
+        self._metadata_index[cache_key] = index
+        return index
+    
+    @staticmethod
+    def _lookup_metadata_prefix(index: Tuple[List[str], List[str]], prefix: str) -> List[Path]:
+        """
+        Find the files in a metadata index whose stem starts with prefix
+        
+        Args:
+            index: Index from _get_metadata_index()
+            prefix: Filename prefix (usually the game name)
+            
+        Returns:
+            List of matching file paths
+        """
+        stems, paths = index
+        
+        # All stems sharing the prefix sort contiguously from the first one >= prefix
+        start = end = bisect_left(stems, prefix)
+        while end < len(stems) and stems[end].startswith(prefix):
+            end += 1
+        
+        return [Path(file_path) for file_path in paths[start:end]]
+    
     def _select_metadata_file(self, files: List[Path], game_name: str, 
                               archive_path: str, dest_name: str) -> Optional[Path]:
         """
@@ -2303,10 +3236,10 @@ class ArchiveExporter:
         if self.auto_select_metadata:
             return files[0]
         
-        print(f"\n{'='*70}")
+        print("\n" + _HRULE)
         print(f"Multiple {archive_path} files found for: {game_name}")
         print(f"Destination allows only one file as: {dest_name}")
-        print(f"{'='*70}")
+        print(_HRULE)
         
         for i, file_path in enumerate(files, 1):
             size_kb = file_path.stat().st_size / 1024
@@ -2347,7 +3280,6 @@ class ArchiveExporter:
         self.logger.info(f"Loading XML metadata from: {xml_file}")
         
         try:
-            import xml.etree.ElementTree as ET
             tree = ET.parse(xml_file)
             root = tree.getroot()
             
@@ -2377,9 +3309,8 @@ class ArchiveExporter:
             self.logger.info(f"✓ Loaded metadata for {games_parsed} games across {len(self.xml_metadata)} platforms")
             
         except Exception as e:
-            self.logger.error(f"Error parsing XML metadata: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            # logger.exception() attaches the traceback to this one record
+            self.logger.exception(f"Error parsing XML metadata: {e}")
     
     def export_gamelist_xml(self, platform_name: str, games: List[Dict]) -> bool:
         """
@@ -2450,9 +3381,6 @@ class ArchiveExporter:
                 self.logger.info(f"  Created directory: {gamelist_dir}")
             
             # Build XML structure
-            import xml.etree.ElementTree as ET
-            from xml.dom import minidom
-            
             root = ET.Element('gameList')
             
             games_with_metadata = 0
@@ -2509,19 +3437,25 @@ class ArchiveExporter:
             
             # Always write the gamelist, even if no metadata
             total_games = games_with_metadata + games_basic_only
-            # Always write the gamelist, even if no metadata
-            total_games = games_with_metadata + games_basic_only
             
-            # Write XML file with pretty formatting
-            xml_string = ET.tostring(root, encoding='unicode')
-            dom = minidom.parseString(xml_string)
-            pretty_xml = dom.toprettyxml(indent='  ')
-            
-            # Remove extra blank lines
-            pretty_xml = '\n'.join([line for line in pretty_xml.split('\n') if line.strip()])
-            
-            with open(gamelist_file, 'w', encoding='utf-8') as f:
-                f.write(pretty_xml)
+            # Write XML file with pretty formatting (ET.indent is available from
+            # Python 3.9 and indents in place - no minidom re-parse of the whole list)
+            if hasattr(ET, 'indent'):
+                ET.indent(root, space="  ")
+                root.tail = "\n"
+                ET.ElementTree(root).write(gamelist_file, encoding='utf-8', xml_declaration=True)
+            else:
+                from xml.dom import minidom
+                
+                xml_string = ET.tostring(root, encoding='unicode')
+                dom = minidom.parseString(xml_string)
+                pretty_xml = dom.toprettyxml(indent='  ')
+                
+                # Remove extra blank lines
+                pretty_xml = '\n'.join([line for line in pretty_xml.split('\n') if line.strip()])
+                
+                with open(gamelist_file, 'w', encoding='utf-8') as f:
+                    f.write(pretty_xml)
             
             self.logger.info(f"✓ Created gamelist.xml: {gamelist_file}")
             self.logger.info(f"  Total games: {total_games}")
@@ -2532,9 +3466,7 @@ class ArchiveExporter:
             return True
             
         except Exception as e:
-            self.logger.error(f"Error creating gamelist.xml for {platform_name}: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"Error creating gamelist.xml for {platform_name}: {e}")
             return False
     
     def _apply_xml_field_conversion(self, field_name: str, value: str, conversions: Dict) -> str:
@@ -2601,79 +3533,78 @@ class ArchiveExporter:
             Formatted report string
         """
         report = []
-        report.append("\n" + "=" * 70)
+        report_append = report.append  # Bound once - called for every line
+        report_append("\n" + _HRULE)
         if self.dry_run:
-            report.append("EXPORT SUMMARY REPORT (DRY RUN)")
+            report_append("EXPORT SUMMARY REPORT (DRY RUN)")
         else:
-            report.append("EXPORT SUMMARY REPORT")
-        report.append("=" * 70)
+            report_append("EXPORT SUMMARY REPORT")
+        report_append(_HRULE)
         
-        total_games = 0
-        total_size = 0
-        total_failed = 0
-        total_skipped = 0
+        totals = Counter()
         
         for platform, stats in platform_stats.items():
-            report.append(f"\n{platform}:")
-            report.append(f"  Games exported: {stats['success']}/{stats['attempted']}")
+            report_append(f"\n{platform}:")
+            report_append(f"  Games exported: {stats['success']}/{stats['attempted']}")
             if stats['skipped'] > 0:
-                report.append(f"  Skipped (already exist): {stats['skipped']}")
+                report_append(f"  Skipped (already exist): {stats['skipped']}")
             if stats['failed'] > 0:
-                report.append(f"  ✗ Failed: {stats['failed']}")
+                report_append(f"  ✗ Failed: {stats['failed']}")
             
-            size_mb = stats['total_size'] / (1024 * 1024)
-            size_gb = size_mb / 1024
-            
-            if size_gb >= 1:
-                report.append(f"  Total size: {size_gb:.2f} GB")
+            # Pick the unit with an integer comparison; divide only for display
+            size_bytes = stats['total_size']
+            if size_bytes >= 1 << 30:
+                report_append(f"  Total size: {size_bytes / (1 << 30):.2f} GB")
             else:
-                report.append(f"  Total size: {size_mb:.2f} MB")
+                report_append(f"  Total size: {size_bytes / (1 << 20):.2f} MB")
             
-            total_games += stats['success']
-            total_size += stats['total_size']
-            total_failed += stats['failed']
-            total_skipped += stats['skipped']
+            totals.update({
+                'success': stats['success'],
+                'total_size': size_bytes,
+                'failed': stats['failed'],
+                'skipped': stats['skipped']
+            })
+        
+        total_games = totals['success']
+        total_size = totals['total_size']
+        total_failed = totals['failed']
+        total_skipped = totals['skipped']
         
-        report.append("\n" + "-" * 70)
+        report_append("\n" + _HRULE_DASH)
         if self.dry_run:
-            report.append(f"TOTAL GAMES THAT WOULD BE EXPORTED: {total_games}")
+            report_append(f"TOTAL GAMES THAT WOULD BE EXPORTED: {total_games}")
         else:
-            report.append(f"TOTAL GAMES EXPORTED: {total_games}")
+            report_append(f"TOTAL GAMES EXPORTED: {total_games}")
         
         if total_skipped > 0:
-            report.append(f"Total skipped (already exist): {total_skipped}")
+            report_append(f"Total skipped (already exist): {total_skipped}")
         
         if total_failed > 0:
-            report.append(f"✗ TOTAL FAILED: {total_failed}")
-            report.append(f"")
-            report.append(f"Check the log file 'archive_export.log' for details on failures.")
+            report_append(f"✗ TOTAL FAILED: {total_failed}")
+            report_append(f"")
+            report_append(f"Check the log file 'archive_export.log' for details on failures.")
             if self.use_symlinks and not self.dry_run:
-                report.append(f"Note: On Windows, symlink creation requires:")
-                report.append(f"  - Administrator privileges, OR")
-                report.append(f"  - Developer Mode enabled")
-                report.append(f"  Alternatively, use --symlink=false to copy files instead")
+                report_append(f"Note: On Windows, symlink creation requires:")
+                report_append(f"  - Administrator privileges, OR")
+                report_append(f"  - Developer Mode enabled")
+                report_append(f"  Alternatively, use --no-symlink to copy files instead")
         
-        total_gb = total_size / (1024 * 1024 * 1024)
-        report.append(f"TOTAL SIZE: {total_gb:.2f} GB")
+        total_gb_str = f"{total_size / (1 << 30):.2f} GB"
+        report_append(f"TOTAL SIZE: {total_gb_str}")
         
         if self.dry_run:
-            report.append(f"Note: DRY RUN - No files were created")
+            report_append(f"Note: DRY RUN - No files were created")
         elif self.use_symlinks:
-            report.append(f"Note: Using symlinks - actual disk space used is minimal")
+            report_append(f"Note: Using symlinks - actual disk space used is minimal")
         else:
-            report.append(f"Note: Files were copied - {total_gb:.2f} GB of disk space used")
-        report.append("=" * 70)
+            report_append(f"Note: Files were copied - {total_gb_str} of disk space used")
+        report_append(_HRULE)
         
         return "\n".join(report)
 
 
-def main():
-    """Main entry point for the script"""
-    parser = argparse.ArgumentParser(
-        description='Export games and metadata from master archive using symlinks',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
+# Usage examples shown after the option list in --help
+_EPILOG_EXAMPLES = """Examples:
   # List all available destination formats
   python init.py --list-formats
   
@@ -2711,14 +3642,126 @@ Examples:
   python init.py --dest /home/user/games --verbose --platform "genesis" --games INTERACTIVE
   
   # Copy files instead of creating symlinks
-  python init.py --symlink false --platform "nes" --games ALL
+  python init.py --no-symlink --platform "nes" --games ALL
   
   # Combine options: copy mode with dry-run to preview disk space needed
-  python init.py --symlink false --dry-run --platform ALL --games ALL
+  python init.py --no-symlink --dry-run --platform ALL --games ALL
   
   # Combine dry-run and verbose for detailed preview
   python init.py --dry-run --verbose --platform ALL --games ALL
-        """
+"""
+
+
+# Values the old '--symlink BOOL' option accepted
+_LEGACY_BOOL_VALUES = frozenset(('true', 'false', 'yes', 'no', '1', '0'))
+
+
+def _list_formats() -> int:
+    """Print all available destination formats (--list-formats)"""
+    try:
+        # Load formats to display them
+        _, config_data = ArchiveExporter.read_formats_file()
+        
+        formats = config_data.get('formats', {})
+        
+        # Build the whole listing and write it in one go
+        lines = ["\nAvailable destination formats:", _HRULE]
+        for fmt_id, fmt_config in formats.items():
+            mappings_count = len(fmt_config.get('platform_mappings', {}))
+            lines.extend((
+                f"\n{fmt_id}:",
+                f"  Name: {fmt_config['name']}",
+                f"  Default destination: {fmt_config['default_destination']}",
+                f"  Description: {fmt_config['description']}",
+                f"  Platform mappings: {mappings_count}",
+            ))
+        lines.append("\n" + _HRULE)
+        sys.stdout.write("\n".join(lines) + "\n")
+        return 0
+        
+    except Exception as e:
+        print(f"Error loading formats: {e}", file=sys.stderr)
+        return 1
+
+
+def _show_mappings(format_id: str) -> int:
+    """Print the platform mappings for a destination format (--show-mappings)"""
+    try:
+        _, config_data = ArchiveExporter.read_formats_file()
+        
+        formats = config_data.get('formats', {})
+        fmt_config = formats.get(format_id)
+        
+        if not fmt_config:
+            print(f"Error: Format '{format_id}' not found", file=sys.stderr)
+            print(f"Available formats: {', '.join(formats.keys())}")
+            return 1
+        
+        mappings = fmt_config.get('platform_mappings', {})
+        
+        # Build the whole table and write it in one go
+        lines = [
+            f"\nPlatform mappings for {fmt_config['name']}:\n",
+            _HRULE + "\n",
+            f"{'Master Archive Platform':<50} | Destination\n",
+            _HRULE_DASH + "\n",
+        ]
+        lines.extend(f"{archive_name:<50} | {dest_name}\n" for archive_name, dest_name in sorted(mappings.items()))
+        lines.append(_HRULE + "\n")
+        lines.append(f"Total mappings: {len(mappings)}\n")
+        sys.stdout.writelines(lines)
+        return 0
+        
+    except Exception as e:
+        print(f"Error showing mappings: {e}", file=sys.stderr)
+        return 1
+
+
+def _translate_legacy_symlink_args(argv: List[str]) -> List[str]:
+    """
+    Rewrite the old '--symlink true/false' form into '--symlink'/'--no-symlink'
+    
+    Without this, the value of '--symlink false' would be taken as a positional
+    argument now that --symlink no longer expects one.
+    
+    Args:
+        argv: Command-line arguments (without the program name)
+        
+    Returns:
+        Arguments with any legacy --symlink values translated
+    """
+    translated = []
+    idx = 0
+    while idx < len(argv):
+        arg = argv[idx]
+        value = None
+        if arg.startswith('--symlink='):
+            value = arg.split('=', 1)[1]
+        elif arg == '--symlink' and idx + 1 < len(argv) and argv[idx + 1].lower() in _LEGACY_BOOL_VALUES:
+            idx += 1
+            value = argv[idx]
+        
+        if value is None:
+            translated.append(arg)
+        else:
+            truthy = value.lower() in ('true', 'yes', '1')
+            translated.append('--symlink' if truthy else '--no-symlink')
+        idx += 1
+    
+    return translated
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line parser (once per process - reused by repeated main() calls)
+    
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description='Export games and metadata from master archive using symlinks',
+        epilog='Run with --examples to see usage examples.'
     )
     
     parser.add_argument(
@@ -2753,6 +3796,12 @@ Examples:
         help='List all available destination formats and exit'
     )
     
+    parser.add_argument(
+        '--examples',
+        action='store_true',
+        help='Show usage examples and exit'
+    )
+    
     parser.add_argument(
         '--show-mappings',
         metavar='FORMAT',
@@ -2825,112 +3874,79 @@ Examples:
         help='Simulate export without creating any symlinks (preview mode)'
     )
     
+    symlink_help = 'Create symlinks (--symlink) or copy files (--no-symlink). Default: symlinks.'
+    if hasattr(argparse, 'BooleanOptionalAction'):
+        parser.add_argument(
+            '--symlink',
+            action=argparse.BooleanOptionalAction,
+            default=True,
+            help=symlink_help
+        )
+    else:
+        # Python < 3.9 has no BooleanOptionalAction - register the pair by hand
+        parser.add_argument('--symlink', action='store_true', default=True, help=symlink_help)
+        parser.add_argument('--no-symlink', dest='symlink', action='store_false', help=argparse.SUPPRESS)
+    
+    parser.add_argument(
+        '--refresh-cache',
+        action='store_true',
+        help='Rescan platform games instead of reusing the scan cached by a previous run '
+             '(stored under $XDG_CACHE_HOME/lb2es-de or ~/.cache/lb2es-de). The cache is '
+             'only invalidated when files are added, removed or renamed - use this after '
+             'replacing a ROM in place'
+    )
+    
     parser.add_argument(
-        '--symlink',
-        type=lambda x: x.lower() in ('true', 'yes', '1'),
-        default=True,
-        metavar='BOOL',
-        help='Create symlinks (true) or copy files (false). Default: true'
+        '--verify',
+        action='store_true',
+        help='Verify that each created symlink resolves to its source (slower on network shares)'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point for the script"""
+    # Introspection flags only need the formats file - answer them before
+    # building the full argument parser (unless help was asked for)
+    argv = sys.argv[1:]
+    if '-h' not in argv and '--help' not in argv:
+        if '--examples' in argv:
+            sys.stdout.write(_EPILOG_EXAMPLES)
+            return 0
+        if '--list-formats' in argv:
+            return _list_formats()
+        for idx, arg in enumerate(argv):
+            # A following option (e.g. --verbose) is not a format id - let
+            # argparse report the missing argument
+            if arg == '--show-mappings' and idx + 1 < len(argv) and not argv[idx + 1].startswith('-'):
+                return _show_mappings(argv[idx + 1])
+            if arg.startswith('--show-mappings='):
+                return _show_mappings(arg.split('=', 1)[1])
+    argv = _translate_legacy_symlink_args(argv)
+    
+    args = _build_parser().parse_args(argv)
+    
+    # Handle --examples
+    if args.examples:
+        sys.stdout.write(_EPILOG_EXAMPLES)
+        return 0
     
     # Handle --list-formats
     if args.list_formats:
-        try:
-            # Load formats to display them
-            script_dir = Path(__file__).parent
-            config_file = script_dir / ArchiveExporter.FORMATS_CONFIG_FILE
-            
-            if not config_file.exists():
-                config_file = Path(ArchiveExporter.FORMATS_CONFIG_FILE)
-            
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
-            
-            formats = config_data.get('formats', {})
-            
-            print("\nAvailable destination formats:")
-            print("=" * 70)
-            for fmt_id, fmt_config in formats.items():
-                print(f"\n{fmt_id}:")
-                print(f"  Name: {fmt_config['name']}")
-                print(f"  Default destination: {fmt_config['default_destination']}")
-                print(f"  Description: {fmt_config['description']}")
-                mappings_count = len(fmt_config.get('platform_mappings', {}))
-                print(f"  Platform mappings: {mappings_count}")
-            print("\n" + "=" * 70)
-            return 0
-            
-        except Exception as e:
-            print(f"Error loading formats: {e}", file=sys.stderr)
-            return 1
+        return _list_formats()
     
     # Handle --show-mappings
     if args.show_mappings:
-        try:
-            script_dir = Path(__file__).parent
-            config_file = script_dir / ArchiveExporter.FORMATS_CONFIG_FILE
-            
-            if not config_file.exists():
-                config_file = Path(ArchiveExporter.FORMATS_CONFIG_FILE)
-            
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
-            
-            formats = config_data.get('formats', {})
-            fmt_config = formats.get(args.show_mappings)
-            
-            if not fmt_config:
-                print(f"Error: Format '{args.show_mappings}' not found", file=sys.stderr)
-                print(f"Available formats: {', '.join(formats.keys())}")
-                return 1
-            
-            mappings = fmt_config.get('platform_mappings', {})
-            
-            print(f"\nPlatform mappings for {fmt_config['name']}:")
-            print("=" * 70)
-            print(f"{'Master Archive Platform':<50} | Destination")
-            print("-" * 70)
-            
-            for archive_name, dest_name in sorted(mappings.items()):
-                print(f"{archive_name:<50} | {dest_name}")
-            
-            print("=" * 70)
-            print(f"Total mappings: {len(mappings)}")
-            return 0
-            
-        except Exception as e:
-            print(f"Error showing mappings: {e}", file=sys.stderr)
-            return 1
+        return _show_mappings(args.show_mappings)
     
     # Determine destination (priority: --dest > positional > format default)
     destination = args.dest_override or args.destination
     
-    # Note: destination can be None - will use format default
+    # Note: destination can be None - will use format default (echoed once
+    # the exporter has loaded the format config)
     if destination:
         print(f"Using custom destination: {destination}")
-    else:
-        # Show what the default will be - need to load formats first
-        try:
-            script_dir = Path(__file__).parent
-            config_file = script_dir / ArchiveExporter.FORMATS_CONFIG_FILE
-            
-            if not config_file.exists():
-                config_file = Path(ArchiveExporter.FORMATS_CONFIG_FILE)
-            
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
-            
-            formats = config_data.get('formats', {})
-            fmt_config = formats.get(args.format)
-            
-            if fmt_config:
-                print(f"Using default destination for {args.format}: {fmt_config['default_destination']}")
-            else:
-                print(f"Warning: Format '{args.format}' not found in configuration")
-        except Exception:
-            pass  # Will be caught during exporter initialization
     
     try:
         # Create exporter instance
@@ -2942,10 +3958,21 @@ Examples:
             dry_run=args.dry_run,
             verbose=args.verbose,
             use_symlinks=args.symlink,
-            backport=args.backport
+            backport=args.backport,
+            verify=args.verify,
+            refresh_cache=args.refresh_cache
         )
         
-        print("\n" + "=" * 70)
+        # Symlinks need extra privileges on Windows - stop before exporting
+        # anything rather than fail every game (or silently copy the archive)
+        if (exporter.use_symlinks and not args.backport_only
+                and not exporter._symlinks_supported()):
+            if not args.dry_run:
+                print(f"\nError: {_SYMLINK_PRIVILEGE_HELP}", file=sys.stderr)
+                return 1
+            print(f"\nWarning: {_SYMLINK_PRIVILEGE_HELP}", file=sys.stderr)
+        
+        print("\n" + _HRULE)
         print("MASTER ARCHIVE EXPORT TOOL")
         if args.dry_run:
             print("*** DRY RUN MODE - NO FILES WILL BE CREATED ***")
@@ -2953,11 +3980,13 @@ Examples:
             print("*** BACKPORT-ONLY MODE - SKIP EXPORT, BACKPORT METADATA ONLY ***")
         elif args.backport:
             print("*** BACKPORT MODE - COPYING METADATA TO ARCHIVE ***")
-        print("=" * 70)
+        print(_HRULE)
         print(f"Format: {exporter.format_config['name']}")
+        if not destination:
+            print(f"Using default destination for {args.format}: {exporter.format_config['default_destination']}")
         print(f"Destination: {exporter.destination}")
         if not args.backport_only:
-            print(f"Mode: {'Symlinks' if args.symlink else 'Copy files'}")
+            print(f"Mode: {'Symlinks' if exporter.use_symlinks else 'Copy files'}")
         if args.verbose:
             print("Verbose logging: ENABLED")
         if args.backport_only:
@@ -2995,6 +4024,9 @@ Examples:
                 print("No platform selected. Exiting.")
                 return 0
         
+        # Export each platform once, in selection order (stats are keyed by platform)
+        platforms_to_export = list(dict.fromkeys(platforms_to_export))
+        
         # Load XML metadata if provided
         if args.infoxml:
             exporter.load_xml_metadata(args.infoxml)
@@ -3006,9 +4038,7 @@ Examples:
             all_backport_stats = {}
             
             for platform in platforms_to_export:
-                print(f"\n{'='*70}")
-                print(f"Platform: {platform}")
-                print(f"{'='*70}")
+                sys.stdout.write(f"\n{_HRULE}\nPlatform: {platform}\n{_HRULE}\n")
                 
                 # Scan games from destination directory
                 games_in_dest = exporter.scan_destination_games(platform)
@@ -3034,9 +4064,9 @@ Examples:
             # Print summary
             if all_backport_stats:
                 total_backported = sum(stats['total'] for stats in all_backport_stats.values())
-                print(f"\n{'='*70}")
+                print("\n" + _HRULE)
                 print("BACKPORT SUMMARY")
-                print(f"{'='*70}")
+                print(_HRULE)
                 print(f"Total files backported: {total_backported}")
                 for platform, stats in all_backport_stats.items():
                     if stats['total'] > 0:
@@ -3056,13 +4086,16 @@ Examples:
         if platforms_to_export and not args.no_metadata:
             exporter._scan_all_metadata_subdirectories()
         
+        # Scan every selected platform's games up front on worker threads; the
+        # per-platform export below stays serial because it can prompt the user
+        exporter.prefetch_platform_games(platforms_to_export)
+        
         # Process each platform
         all_platform_stats = {}
+        metadata_types = frozenset(args.metadata_types)
         
         for platform in platforms_to_export:
-            print(f"\n{'='*70}")
-            print(f"Platform: {platform}")
-            print(f"{'='*70}")
+            sys.stdout.write(f"\n{_HRULE}\nPlatform: {platform}\n{_HRULE}\n")
             
             # Select games
             if args.games:
@@ -3089,13 +4122,13 @@ Examples:
                 metadata_stats = exporter.export_metadata(
                     platform, 
                     stats['games_for_metadata'],  # Use tracked games instead of all selected
-                    metadata_types=args.metadata_types,
+                    metadata_types=metadata_types,
                     force=args.force
                 )
                 print(f"\nMetadata exported:")
-                for mtype, count in metadata_stats.items():
-                    if count > 0 and mtype != 'total':
-                        print(f"  {mtype}: {count} files")
+                printable = {k: v for k, v in metadata_stats.items() if v and k != 'total'}
+                for mtype, count in printable.items():
+                    print(f"  {mtype}: {count} files")
             
             # Backport metadata from destination to archive if requested
             if args.backport and stats['games_for_metadata']:
@@ -3115,24 +4148,30 @@ Examples:
                     print(f"\n→ Generating gamelist.xml for {platform}...")
                     exporter.export_gamelist_xml(platform, stats['games_for_metadata'])
         
+        # Write any custom systems or playlist entries added during the export
+        exporter.flush_custom_systems()
+        exporter.flush_retroarch_playlists()
+        
         # Generate and print report
         if all_platform_stats:
             print(exporter.generate_report(all_platform_stats))
         
         # Show unmapped platforms summary
         if exporter.unmapped_platforms:
-            print("\n" + "!" * 70)
-            print("UNMAPPED PLATFORMS")
-            print("!" * 70)
-            print("The following platforms were not mapped and were skipped:")
-            for platform in exporter.unmapped_platforms:
-                print(f"  - {platform}")
-            print("\nTo add support for these platforms:")
-            print(f"  1. Edit fe_formats.json and add mappings in 'platform_mappings'")
+            lines = [
+                "\n" + _HRULE_BANG,
+                "UNMAPPED PLATFORMS",
+                _HRULE_BANG,
+                "The following platforms were not mapped and were skipped:",
+            ]
+            lines.extend(f"  - {platform}" for platform in exporter.unmapped_platforms)
+            lines.append("\nTo add support for these platforms:")
+            lines.append(f"  1. Edit fe_formats.json and add mappings in 'platform_mappings'")
             if exporter.dest_format in ['es-de', 'retroarch']:
                 system_type = "custom systems" if exporter.dest_format == 'es-de' else "playlists"
-                print(f"  2. Or run without --dry-run to interactively add as {system_type}")
-            print("!" * 70)
+                lines.append(f"  2. Or run without --dry-run to interactively add as {system_type}")
+            lines.append(_HRULE_BANG)
+            sys.stdout.write("\n".join(lines) + "\n")
         
         if args.dry_run:
             print("\n✓ Dry run completed successfully! (No files were created)")
@@ -3143,11 +4182,20 @@ Examples:
     except KeyboardInterrupt:
         print("\n\nExport cancelled by user.")
         return 130
+    except FileNotFoundError as e:
+        # Usually the formats file (--config and --infoxml handle their own errors)
+        print(f"\nError: {e}", file=sys.stderr)
+        print(
+            f"Check that {ArchiveExporter.FORMATS_CONFIG_FILE} is next to this script "
+            f"or in the current directory.",
+            file=sys.stderr
+        )
+        return 1
     except Exception as e:
         print(f"\nError: {e}", file=sys.stderr)
         if args.verbose:
-            import traceback
-            traceback.print_exc()
+            # Also lands in archive_export.log once the exporter set up logging
+            logging.getLogger('ArchiveExporter').exception("Unhandled error")
         return 1
 
 